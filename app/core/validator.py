@@ -5,6 +5,9 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Longest CLI error output kept in a validation result
+MAX_ERROR_OUTPUT_CHARS = 64 * 1024
+
 @dataclass
 class ValidationResult:
     """Result of Polar validation"""
@@ -61,9 +64,11 @@ class PolarValidator:
         """Run oso-cloud CLI command and return error output if any"""
         try:
             command = [self.cli_path] + args
-            result = subprocess.run(
+            # Only stderr is reported, so stdout is discarded rather than buffered
+            subprocess.run(
                 command,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 timeout=self.timeout,
                 check=True
@@ -71,7 +76,10 @@ class PolarValidator:
             return None  # No error
         except subprocess.CalledProcessError as e:
             logger.error(f"CLI command failed: {e}")
-            return e.stderr
+            stderr = e.stderr
+            if stderr and len(stderr) > MAX_ERROR_OUTPUT_CHARS:
+                stderr = stderr[:MAX_ERROR_OUTPUT_CHARS] + "\n... (output truncated)"
+            return stderr
         except subprocess.TimeoutExpired:
             logger.error(f"CLI command timed out after {self.timeout} seconds")
             return "Command timed out"
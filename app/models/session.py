@@ -2,8 +2,9 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from enum import Enum
+import bisect
 import uuid
 
 
@@ -82,6 +83,30 @@ class Session:
     notes: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
     
+    # In-memory change counter, bumped on every update; not persisted
+    version: int = field(default=0, init=False, repr=False, compare=False)
+    
+    # Lookup indexes derived from the lists above; not part of the persisted data
+    _policies_by_id: Dict[str, GeneratedPolicy] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _latest_validation_by_policy: Dict[str, ValidationResult] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _validation_counts_by_policy: Dict[str, List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Chronological copy of validation_results, so reads never reorder the public list
+    _validations_by_time: List[ValidationResult] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # id() of the (policies, validations) lists the indexes were built from
+    _indexed_list_ids: Tuple[int, int] = field(default=(0, 0), init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.validation_results.sort(key=lambda r: r.validated_at)
+        self._reindex()
+    
     @classmethod
     def create(cls, name: str) -> 'Session':
         """Create a new session with auto-generated ID and timestamps."""
@@ -94,11 +119,14 @@ class Session:
         )
     
     def update_timestamp(self) -> None:
-        """Update the session's last modified timestamp."""
+        """Update the session's last modified timestamp and bump its version."""
         self.updated_at = datetime.utcnow()
+        self.version += 1
     
     def add_policy(self, policy: GeneratedPolicy) -> None:
         """Add a new policy and mark it as current."""
+        self._ensure_index()
+        
         # Mark all existing policies as not current
         for existing_policy in self.generated_policies:
             existing_policy.is_current = False
@@ -106,8 +134,14 @@ class Session:
         # Add the new policy as current
         policy.is_current = True
         self.generated_policies.append(policy)
+        self._policies_by_id[policy.id] = policy
         self.update_timestamp()
     
+    def get_policy(self, policy_id: str) -> Optional[GeneratedPolicy]:
+        """Get a policy by ID."""
+        self._ensure_index()
+        return self._policies_by_id.get(policy_id)
+    
     def get_current_policy(self) -> Optional[GeneratedPolicy]:
         """Get the current active policy."""
         for policy in self.generated_policies:
@@ -115,17 +149,92 @@ class Session:
                 return policy
         return None
     
+    def remove_policy(self, policy_id: str) -> Optional[GeneratedPolicy]:
+        """Remove a policy and its validation results from the session."""
+        self._ensure_index()
+        policy = self._policies_by_id.pop(policy_id, None)
+        if policy is None:
+            return None
+        
+        self.generated_policies.remove(policy)
+        if policy_id in self._latest_validation_by_policy:
+            del self._latest_validation_by_policy[policy_id]
+            del self._validation_counts_by_policy[policy_id]
+            self.validation_results = [r for r in self.validation_results if r.policy_id != policy_id]
+            self._validations_by_time = [r for r in self._validations_by_time if r.policy_id != policy_id]
+            self._indexed_list_ids = (id(self.generated_policies), id(self.validation_results))
+        
+        # If this was the current policy, make the latest remaining policy current
+        if policy.is_current and self.generated_policies:
+            self.generated_policies[-1].is_current = True
+        
+        self.update_timestamp()
+        return policy
+    
     def add_validation_result(self, result: ValidationResult) -> None:
-        """Add a validation result to the session."""
+        """Add a validation result to the session, keeping results in chronological order."""
+        self._ensure_index()
+        out_of_order = bool(self.validation_results) and result.validated_at < self.validation_results[-1].validated_at
         self.validation_results.append(result)
+        if out_of_order:
+            self.validation_results.sort(key=lambda r: r.validated_at)
+        bisect.insort(self._validations_by_time, result, key=lambda r: r.validated_at)
+        self._index_validation(result)
+        self.update_timestamp()
+    
+    def clear_validation_results(self) -> None:
+        """Remove all validation results from the session."""
+        self.validation_results = []
+        self._latest_validation_by_policy.clear()
+        self._validation_counts_by_policy.clear()
+        self._validations_by_time = []
+        self._indexed_list_ids = (id(self.generated_policies), id(self.validation_results))
         self.update_timestamp()
     
     def get_latest_validation(self, policy_id: str) -> Optional[ValidationResult]:
         """Get the most recent validation result for a specific policy."""
-        policy_results = [r for r in self.validation_results if r.policy_id == policy_id]
-        if policy_results:
-            return max(policy_results, key=lambda r: r.validated_at)
-        return None
+        self._ensure_index()
+        return self._latest_validation_by_policy.get(policy_id)
+    
+    def get_recent_validations(self, limit: int) -> List[ValidationResult]:
+        """Get up to `limit` validation results, most recent first."""
+        self._ensure_index()
+        return self._validations_by_time[:-limit - 1:-1] if limit > 0 else []
+    
+    def get_validation_counts(self) -> Dict[str, Tuple[int, int]]:
+        """Get (total, successful) validation counts per policy ID."""
+        self._ensure_index()
+        return {policy_id: (total, successful)
+                for policy_id, (total, successful) in self._validation_counts_by_policy.items()}
+    
+    def _index_validation(self, result: ValidationResult) -> None:
+        """Count a validation result and record it if it is the latest for its policy."""
+        counts = self._validation_counts_by_policy.setdefault(result.policy_id, [0, 0])
+        counts[0] += 1
+        if result.is_valid:
+            counts[1] += 1
+        
+        latest = self._latest_validation_by_policy.get(result.policy_id)
+        if latest is None or result.validated_at >= latest.validated_at:
+            self._latest_validation_by_policy[result.policy_id] = result
+    
+    def _ensure_index(self) -> None:
+        """Rebuild the lookup indexes if the lists were modified or replaced directly."""
+        if (self._indexed_list_ids != (id(self.generated_policies), id(self.validation_results))
+                or len(self._policies_by_id) != len(self.generated_policies)
+                or len(self._validations_by_time) != len(self.validation_results)):
+            self._reindex()
+    
+    def _reindex(self) -> None:
+        """Rebuild the lookup indexes from the policy and validation lists."""
+        self._policies_by_id = {p.id: p for p in self.generated_policies}
+        self._latest_validation_by_policy = {}
+        self._validation_counts_by_policy = {}
+        # Sort a copy: this runs from read paths, which must not reorder the public list
+        self._validations_by_time = sorted(self.validation_results, key=lambda r: r.validated_at)
+        for result in self._validations_by_time:
+            self._index_validation(result)
+        self._indexed_list_ids = (id(self.generated_policies), id(self.validation_results))
     
     def to_metadata(self) -> SessionMetadata:
         """Convert to lightweight metadata representation."""
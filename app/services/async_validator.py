@@ -61,7 +61,8 @@ class AsyncPolarValidator:
     """Async Polar validator with session integration and caching."""
     
     def __init__(self, cli_path: str = "oso-cloud", timeout: int = 30, 
-                 cache_ttl: int = 3600, max_concurrent: int = 5):
+                 cache_ttl: int = 3600, max_concurrent: int = 5,
+                 executor: Optional[ThreadPoolExecutor] = None):
         """Initialize the async validator.
         
         Args:
@@ -69,10 +70,13 @@ class AsyncPolarValidator:
             timeout: Timeout for validation operations
             cache_ttl: Cache time-to-live in seconds
             max_concurrent: Maximum concurrent validation operations
+            executor: Optional shared thread pool to run validations on; it is
+                not shut down by close(). max_concurrent is ignored when given.
         """
         self.core_validator = PolarValidator(cli_path=cli_path, timeout=timeout)
         self.cache_ttl = cache_ttl
-        self.executor = ThreadPoolExecutor(max_workers=max_concurrent)
+        self._owns_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_concurrent)
         
         # In-memory cache and history
         self._validation_cache: Dict[str, ValidationCacheEntry] = {}
@@ -314,7 +318,8 @@ class AsyncPolarValidator:
     
     async def close(self):
         """Clean up resources."""
-        self.executor.shutdown(wait=True)
+        if self._owns_executor:
+            self.executor.shutdown(wait=True)
     
     def _hash_policy_content(self, content: str) -> str:
         """Generate hash for policy content for caching."""
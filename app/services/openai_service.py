@@ -1,6 +1,6 @@
 import os
 import time
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Generator
 from openai import OpenAI
 from ..models.policy import PolicyGenerationRequest, PolicyGenerationResult
 from ..models.session import Session
@@ -64,6 +64,29 @@ class SessionAwareOpenAIService:
                              callback: Callable[[str], None]) -> PolicyGenerationResult:
         """Generate Polar policy with streaming support"""
         start_time = time.time()
+        stream = self.iter_policy_stream(request, session)
+
+        try:
+            while True:
+                callback(next(stream))
+        except StopIteration as stop:
+            return stop.value
+        except Exception as e:
+            stream.close()
+            return PolicyGenerationResult(
+                success=False,
+                error_message=str(e),
+                model_used=request.model_config.get("model", self.default_model),
+                generation_time=time.time() - start_time
+            )
+    
+    def iter_policy_stream(self, request: PolicyGenerationRequest,
+                           session: Session) -> Generator[str, None, PolicyGenerationResult]:
+        """Stream a Polar policy, yielding content deltas as they arrive.
+        
+        The generator's return value is the final PolicyGenerationResult.
+        """
+        start_time = time.time()
         
         try:
             # Build context-aware messages
@@ -90,7 +113,7 @@ class SessionAwareOpenAIService:
                 if chunk.choices[0].delta.content is not None:
                     chunk_content = chunk.choices[0].delta.content
                     content_parts.append(chunk_content)
-                    callback(chunk_content)
+                    yield chunk_content
                 
                 # Get usage info from final chunk if available
                 if hasattr(chunk, 'usage') and chunk.usage:
@@ -1,8 +1,10 @@
 """Simplified policy generator for session-based Polar policy generation."""
 
+import asyncio
 import time
 import logging
-from typing import Optional, List, Callable
+from concurrent.futures import Executor
+from typing import Optional, List, Callable, Generator, Union
 from datetime import datetime
 
 from ..models.session import Session, GeneratedPolicy
@@ -45,6 +47,16 @@ class SessionPolicyGenerator:
         result = self.ai_service.generate_policy_stream(request, session, callback)
         return self._process_generation_result(result, session, "streaming policy")
     
+    def iter_chunks(self, request: PolicyGenerationRequest,
+                    session: Session) -> Generator[str, None, PolicyGenerationResult]:
+        """Generate a Polar policy, yielding content deltas as they stream in.
+        
+        The generator's return value is the processed PolicyGenerationResult.
+        """
+        logger.info(f"Generating policy with streaming for session {session.id}")
+        result = yield from self.ai_service.iter_policy_stream(request, session)
+        return self._process_generation_result(result, session, "streaming policy")
+    
     def _process_generation_result(self, result: PolicyGenerationResult, 
                                  session: Session, generation_type: str) -> PolicyGenerationResult:
         """Process generation result and add policy to session if successful"""
@@ -103,6 +115,16 @@ class SessionPolicyGenerator:
                 validation_time=validation_time
             )
     
+    async def validate_policy_async(self, policy_content: str, policy_id: str, session_id: str,
+                                    executor: Optional[Executor] = None) -> PolicyValidationResult:
+        """Validate a generated policy on an executor without blocking the event loop.
+        
+        Without an executor the loop's default pool is used; pass a shared one to
+        bound concurrency across calls.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, self.validate_policy, policy_content, policy_id, session_id)
+    
     def retry_policy_generation(self, 
                               session: Session,
                               validation_errors: List[str],
@@ -119,10 +141,37 @@ class SessionPolicyGenerator:
         return self._retry_policy_generation_internal(session, validation_errors, retry_count, 
                                                     streaming=True, callback=callback)
     
+    def iter_retry_chunks(self,
+                          session: Session,
+                          validation_errors: List[str],
+                          retry_count: int = 0) -> Generator[str, None, PolicyGenerationResult]:
+        """Retry policy generation with error context, yielding content deltas as they stream in"""
+        retry_request = self._prepare_retry_request(session, validation_errors, retry_count, streaming=True)
+        if isinstance(retry_request, PolicyGenerationResult):
+            return retry_request
+        
+        result = yield from self.ai_service.iter_policy_stream(retry_request, session)
+        return self._process_generation_result(result, session, "retry policy (streaming)")
+    
     def _retry_policy_generation_internal(self, session: Session, validation_errors: List[str],
                                         retry_count: int, streaming: bool = False,
                                         callback: Optional[Callable[[str], None]] = None) -> PolicyGenerationResult:
         """Internal method for retry policy generation"""
+        retry_request = self._prepare_retry_request(session, validation_errors, retry_count, streaming)
+        if isinstance(retry_request, PolicyGenerationResult):
+            return retry_request
+        
+        # Generate new policy
+        if streaming and callback:
+            result = self.ai_service.generate_policy_stream(retry_request, session, callback)
+        else:
+            result = self.ai_service.generate_policy(retry_request, session)
+        
+        return self._process_generation_result(result, session, f"retry policy{' (streaming)' if streaming else ''}")
+    
+    def _prepare_retry_request(self, session: Session, validation_errors: List[str], retry_count: int,
+                               streaming: bool) -> Union[PolicyGenerationRequest, PolicyGenerationResult]:
+        """Check retry conditions and build the retry request, or return a failed result"""
         if retry_count >= self.max_retries:
             logger.error(f"Maximum retry attempts ({self.max_retries}) reached for session {session.id}")
             return PolicyGenerationResult(
@@ -143,15 +192,7 @@ class SessionPolicyGenerator:
             )
         
         # Create retry request
-        retry_request = self._build_retry_request(session, current_policy, validation_errors, retry_count)
-        
-        # Generate new policy
-        if streaming and callback:
-            result = self.ai_service.generate_policy_stream(retry_request, session, callback)
-        else:
-            result = self.ai_service.generate_policy(retry_request, session)
-        
-        return self._process_generation_result(result, session, f"retry policy{' (streaming)' if streaming else ''}")
+        return self._build_retry_request(session, current_policy, validation_errors, retry_count)
     
     def _build_retry_request(self, session: Session, current_policy: GeneratedPolicy,
                            validation_errors: List[str], retry_count: int) -> PolicyGenerationRequest:
@@ -8,7 +8,7 @@ This service provides high-level session management functionality including:
 """
 
 import json
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from dataclasses import asdict
 
@@ -49,6 +49,10 @@ class SessionManager:
         """
         self.storage = storage_backend
         self.session_storage = SessionStorage(storage_backend)
+        
+        # In-memory change counter, bumped whenever a session is created,
+        # saved or deleted through this manager; usable as a cache key
+        self.version = 0
     
     def create_session(self, name: str, description: str = "") -> Session:
         """
@@ -85,6 +89,7 @@ class SessionManager:
             
             # Store initial session data
             self._persist_session(session)
+            self.version += 1
             
             return session
             
@@ -163,6 +168,7 @@ class SessionManager:
             storage_metadata.name = session.name
             storage_metadata.updated_at = session.updated_at
             self.session_storage.update_session_metadata(storage_metadata)
+            self.version += 1
             
             return True
             
@@ -170,13 +176,18 @@ class SessionManager:
             raise SessionManagerError(f"Failed to save session: {str(e)}")
     
     def list_sessions(self, limit: Optional[int] = None, 
-                     search_term: Optional[str] = None) -> List[SessionMetadata]:
+                     search_term: Optional[str] = None,
+                     offset: int = 0) -> List[SessionMetadata]:
         """
         List sessions with optional filtering and search.
         
+        Filtering, sorting and paging use the stored session metadata, so
+        only the sessions on the requested page are loaded in full.
+        
         Args:
             limit: Maximum number of sessions to return
             search_term: Optional search term to filter by name
+            offset: Number of matching sessions to skip
             
         Returns:
             List of SessionMetadata objects sorted by update time (newest first)
@@ -185,9 +196,23 @@ class SessionManager:
             SessionManagerError: If listing fails
         """
         try:
-            # Get all sessions from storage
+            # Get all session metadata from storage, newest first
             storage_sessions = self.session_storage.list_sessions()
             
+            # Apply search filter if provided
+            if search_term and search_term.strip():
+                search_lower = search_term.strip().lower()
+                storage_sessions = [
+                    s for s in storage_sessions 
+                    if search_lower in s.name.lower()
+                ]
+            
+            # Apply offset and limit before loading any session data
+            if offset > 0:
+                storage_sessions = storage_sessions[offset:]
+            if limit and limit > 0:
+                storage_sessions = storage_sessions[:limit]
+            
             # Convert storage metadata to our SessionMetadata format
             sessions = []
             for storage_session in storage_sessions:
@@ -210,26 +235,29 @@ class SessionManager:
                     )
                     sessions.append(session_metadata)
             
-            # Apply search filter if provided
-            if search_term and search_term.strip():
-                search_lower = search_term.strip().lower()
-                sessions = [
-                    s for s in sessions 
-                    if search_lower in s.name.lower()
-                ]
-            
             # Sort by updated_at descending (newest first)
             sessions.sort(key=lambda s: s.updated_at, reverse=True)
             
-            # Apply limit if specified
-            if limit and limit > 0:
-                sessions = sessions[:limit]
-            
             return sessions
             
         except StorageError as e:
             raise SessionManagerError(f"Failed to list sessions: {str(e)}")
     
+    def list_session_summaries(self) -> List[Tuple[str, str]]:
+        """
+        List session IDs and names without loading full session data.
+        
+        Returns:
+            List of (session_id, name) tuples sorted by update time (newest first)
+            
+        Raises:
+            SessionManagerError: If listing fails
+        """
+        try:
+            return [(s.id, s.name) for s in self.session_storage.list_sessions()]
+        except StorageError as e:
+            raise SessionManagerError(f"Failed to list sessions: {str(e)}")
+    
     def delete_session(self, session_id: str) -> bool:
         """
         Delete a session and all its data.
@@ -247,7 +275,9 @@ class SessionManager:
             raise SessionValidationError("Session ID cannot be empty")
         
         try:
-            return self.session_storage.delete_session(session_id)
+            deleted = self.session_storage.delete_session(session_id)
+            self.version += 1
+            return deleted
         except StorageError as e:
             raise SessionManagerError(f"Failed to delete session: {str(e)}")
     
@@ -469,39 +499,44 @@ class SessionManager:
         Raises:
             StorageError: If loading fails
         """
+        # List the session's files once and read everything needed in one batch,
+        # instead of an existence check and a read per file
+        session_files = self.session_storage.list_session_files(session.id)
+        existing_files = set(session_files)
+        policy_files = [f for f in session_files if f.startswith("policies/") and f.endswith(".polar")]
+        validation_files = [f for f in session_files if f.startswith("validation_results/") and f.endswith(".json")]
+        
+        files_to_read = [f for f in ("requirements.txt", "notes.md", "session.json") if f in existing_files]
+        files_to_read.extend(policy_files)
+        files_to_read.extend(
+            metadata_file for metadata_file in
+            (f"policies/{self._policy_id_from_file(f)}_metadata.json" for f in policy_files)
+            if metadata_file in existing_files
+        )
+        files_to_read.extend(validation_files)
+        contents = self.session_storage.get_session_files(session.id, files_to_read)
+        
         # Load requirements
-        if self.session_storage.session_file_exists(session.id, "requirements.txt"):
-            session.requirements_text = self.session_storage.get_session_file(
-                session.id, "requirements.txt"
-            )
+        if "requirements.txt" in contents:
+            session.requirements_text = contents["requirements.txt"]
         
         # Load notes
-        if self.session_storage.session_file_exists(session.id, "notes.md"):
-            session.notes = self.session_storage.get_session_file(
-                session.id, "notes.md"
-            )
+        if "notes.md" in contents:
+            session.notes = contents["notes.md"]
         
         # Load session metadata if exists
-        if self.session_storage.session_file_exists(session.id, "session.json"):
-            session_data = json.loads(
-                self.session_storage.get_session_file(session.id, "session.json")
-            )
+        if "session.json" in contents:
+            session_data = json.loads(contents["session.json"])
             session.metadata = session_data.get("metadata", {})
         
         # Load generated policies
-        session_files = self.session_storage.list_session_files(session.id)
-        policy_files = [f for f in session_files if f.startswith("policies/") and f.endswith(".polar")]
-        
         for policy_file in policy_files:
-            policy_id = policy_file.split("/")[1].replace(".polar", "")
-            
-            # Load policy content
-            policy_content = self.session_storage.get_session_file(session.id, policy_file)
+            policy_id = self._policy_id_from_file(policy_file)
             
-            # Load policy metadata
-            metadata_file = f"policies/{policy_id}_metadata.json"
-            if self.session_storage.session_file_exists(session.id, metadata_file):
-                metadata_content = self.session_storage.get_session_file(session.id, metadata_file)
+            # Load policy content and metadata
+            policy_content = contents.get(policy_file)
+            metadata_content = contents.get(f"policies/{policy_id}_metadata.json")
+            if policy_content is not None and metadata_content is not None:
                 metadata = json.loads(metadata_content)
                 
                 policy = GeneratedPolicy(
@@ -516,10 +551,10 @@ class SessionManager:
                 session.generated_policies.append(policy)
         
         # Load validation results
-        validation_files = [f for f in session_files if f.startswith("validation_results/") and f.endswith(".json")]
-        
         for validation_file in validation_files:
-            validation_content = self.session_storage.get_session_file(session.id, validation_file)
+            validation_content = contents.get(validation_file)
+            if validation_content is None:
+                continue
             validation_data = json.loads(validation_content)
             
             result = ValidationResult(
@@ -530,4 +565,9 @@ class SessionManager:
                 validated_at=datetime.fromisoformat(validation_data["validated_at"]),
                 validation_time=validation_data.get("validation_time", 0.0)
             )
-            session.validation_results.append(result)
\ No newline at end of file
+            session.validation_results.append(result)
+    
+    @staticmethod
+    def _policy_id_from_file(policy_file: str) -> str:
+        """Get the policy ID from a "policies/<id>.polar" file name."""
+        return policy_file.split("/")[1].replace(".polar", "")
\ No newline at end of file
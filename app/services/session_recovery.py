@@ -2,7 +2,8 @@
 
 import json
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -11,10 +12,14 @@ from ..models.session import Session, SessionMetadata
 from ..models.events import SessionEvent, EventType
 from ..services.session_manager import SessionManager, SessionManagerError
 from ..services.event_logger import EventLogger, EventReplayError
-from ..storage.base import StorageBackend, StorageError, StorageNotFoundError
+from ..storage.base import StorageBackend, StorageError, StorageNotFoundError, StorageObjectInfo
 
 logger = logging.getLogger(__name__)
 
+# Integrity analysis is I/O bound (storage and event log reads), so a small
+# thread pool overlaps the per-session reads during a full scan.
+_SCAN_WORKERS = 10
+
 
 class RecoveryStatus(Enum):
     """Status of recovery operations."""
@@ -184,19 +189,24 @@ class SessionRecoveryService:
         
         return result
     
-    def scan_all_sessions(self) -> IntegrityReport:
+    def scan_all_sessions(self, progress_callback: Optional[Callable[[int, int], None]] = None
+                          ) -> IntegrityReport:
         """
         Scan all sessions for integrity issues.
         
+        Args:
+            progress_callback: Optional callable invoked as (completed, total)
+                after each session is analyzed
+            
         Returns:
             IntegrityReport with comprehensive analysis
         """
         start_time = datetime.now()
         
         try:
-            # Get all session IDs
-            session_metadatas = self.session_manager.list_sessions()
-            session_ids = [meta.id for meta in session_metadatas]
+            # Get all session IDs without loading every session
+            session_ids = [session_id for session_id, _ in
+                           self.session_manager.list_session_summaries()]
             
             total_sessions = len(session_ids)
             healthy_sessions = 0
@@ -207,28 +217,38 @@ class SessionRecoveryService:
             
             logger.info(f"Starting integrity scan of {total_sessions} sessions")
             
-            for session_id in session_ids:
-                try:
-                    issues = self._analyze_session_integrity(session_id)
+            with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._analyze_session_integrity, session_id): session_id
+                    for session_id in session_ids
+                }
+                
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    session_id = futures[future]
+                    try:
+                        issues = future.result()
+                        
+                        if not issues:
+                            healthy_sessions += 1
+                        else:
+                            corrupted_sessions += 1
+                            
+                            # Check if recoverable
+                            if self._is_session_recoverable(issues):
+                                recoverable_sessions += 1
+                            
+                            # Count issues by type
+                            for issue in issues:
+                                if issue.type not in issues_by_type:
+                                    issues_by_type[issue.type] = 0
+                                issues_by_type[issue.type] += 1
                     
-                    if not issues:
-                        healthy_sessions += 1
-                    else:
+                    except Exception as e:
+                        logger.error(f"Failed to analyze session {session_id}: {e}")
                         corrupted_sessions += 1
-                        
-                        # Check if recoverable
-                        if self._is_session_recoverable(issues):
-                            recoverable_sessions += 1
-                        
-                        # Count issues by type
-                        for issue in issues:
-                            if issue.type not in issues_by_type:
-                                issues_by_type[issue.type] = 0
-                            issues_by_type[issue.type] += 1
-                
-                except Exception as e:
-                    logger.error(f"Failed to analyze session {session_id}: {e}")
-                    corrupted_sessions += 1
+                    
+                    if progress_callback:
+                        progress_callback(completed, total_sessions)
             
             # Generate recommendations
             recommendations = self._generate_recommendations(issues_by_type, 
@@ -378,12 +398,14 @@ class SessionRecoveryService:
             List of backup information
         """
         try:
+            # Only listing metadata is used, backup bodies are never read here
             prefix = f"{self.backup_prefix}{session_id}_"
-            result = self.storage.list_objects(prefix=prefix)
             
             backups = []
-            for obj_info in result['objects']:
-                timestamp = obj_info.key.split('_')[-1].replace('.json', '')
+            for obj_info in self._list_all_objects(prefix):
+                if not obj_info.key.endswith('.json'):
+                    continue
+                timestamp = obj_info.key[len(prefix):-len('.json')]
                 backups.append({
                     "key": obj_info.key,
                     "timestamp": timestamp,
@@ -399,8 +421,67 @@ class SessionRecoveryService:
             logger.error(f"Failed to list backups for session {session_id}: {e}")
             return []
     
+    def get_dashboard_snapshot(self) -> Dict[str, Any]:
+        """
+        Get the data shared by the recovery dashboard tabs in one pass.
+        
+        Returns:
+            Dictionary with "sessions" as (session_id, name) pairs and
+            "backup_counts" mapping session IDs to their number of backups
+        """
+        sessions = self.session_manager.list_session_summaries()
+        
+        backup_counts: Dict[str, int] = {}
+        try:
+            for obj_info in self._list_all_objects(self.backup_prefix):
+                name = obj_info.key[len(self.backup_prefix):]
+                session_id, separator, _ = name.partition('_')
+                if separator and name.endswith('.json'):
+                    backup_counts[session_id] = backup_counts.get(session_id, 0) + 1
+        except Exception as e:
+            logger.warning(f"Failed to count session backups: {e}")
+        
+        return {"sessions": sessions, "backup_counts": backup_counts}
+    
+    def get_session_fingerprint(self, session_id: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Get a cheap fingerprint of a session's stored files.
+        
+        The fingerprint is built from object listings (key and etag) only, so it
+        changes whenever the session or its event log is rewritten without
+        reading any file contents.
+        
+        Args:
+            session_id: Session ID to fingerprint
+            
+        Returns:
+            Sorted tuple of (key, etag) pairs
+        """
+        fingerprint = []
+        for prefix in (f"sessions/{session_id}/", f"events/{session_id}_events.jsonl"):
+            result = self.storage.list_objects(prefix=prefix)
+            fingerprint.extend((obj.key, obj.etag or str(obj.last_modified))
+                               for obj in result["objects"])
+        return tuple(sorted(fingerprint))
+    
     # Private methods
     
+    def _list_all_objects(self, prefix: str) -> List[StorageObjectInfo]:
+        """List every object under a prefix, following continuation tokens."""
+        objects: List[StorageObjectInfo] = []
+        continuation_token = None
+        while True:
+            result = self.storage.list_objects(prefix=prefix,
+                                               continuation_token=continuation_token)
+            objects.extend(result['objects'])
+            continuation_token = result.get('next_continuation_token')
+            if not result.get('is_truncated') or not continuation_token:
+                break
+        
+        if result.get('is_truncated') and not continuation_token:
+            logger.warning(f"Listing of {prefix!r} was truncated at {len(objects)} objects")
+        return objects
+    
     def _analyze_session_integrity(self, session_id: str) -> List[CorruptionIssue]:
         """Analyze a session for integrity issues."""
         issues = []
@@ -269,6 +269,27 @@ class StorageBackend(ABC):
                 results[key] = False
         return results
     
+    def batch_get_objects(self, keys: List[str]) -> Dict[str, StorageObject]:
+        """
+        Get multiple objects in batch
+        
+        Args:
+            keys: List of object keys to get
+            
+        Returns:
+            Dictionary mapping keys to objects; keys that don't exist are omitted
+            
+        Raises:
+            StorageError: If any existing object cannot be read
+        """
+        results = {}
+        for key in keys:
+            try:
+                results[key] = self.get_object(key)
+            except StorageNotFoundError:
+                pass
+        return results
+    
     def list_object_versions(self, key: str) -> List[StorageObjectInfo]:
         """
         List all versions of an object (if versioning supported)
@@ -1,5 +1,6 @@
 import os
 import hashlib
+import itertools
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
@@ -100,13 +101,18 @@ class LocalStorageBackend(StorageBackend):
                 if prefix_path.is_file():
                     # If prefix points to a file, return just that file
                     search_path = prefix_path.parent
-                    pattern = prefix_path.name + "*"
+                    patterns = [prefix_path.name + "*"]
+                elif not prefix.endswith('/') and not prefix_path.is_dir():
+                    # Partial key name (e.g. "backups/<id>_"): match siblings by name,
+                    # including keys nested under matching directories, as S3 does
+                    search_path = prefix_path.parent
+                    patterns = [prefix_path.name + "*", prefix_path.name + "*/**/*"]
                 else:
                     search_path = prefix_path
-                    pattern = "**/*"  # Use recursive pattern for directories
+                    patterns = ["**/*"]  # Use recursive pattern for directories
             else:
                 search_path = self.base_path
-                pattern = "**/*"
+                patterns = ["**/*"]
             
             if not search_path.exists():
                 return {
@@ -119,7 +125,7 @@ class LocalStorageBackend(StorageBackend):
             objects = []
             count = 0
             
-            for file_path in search_path.glob(pattern):
+            for file_path in itertools.chain.from_iterable(search_path.glob(p) for p in patterns):
                 if count >= max_keys:
                     break
                     
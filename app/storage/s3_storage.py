@@ -4,6 +4,7 @@ S3-compatible storage backend implementation using boto3
 
 import json
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from urllib.parse import urlparse
@@ -14,6 +15,9 @@ from .base import (
     StorageConnectionError, StorageConfigurationError
 )
 
+# Concurrent GET requests issued by batch_get_objects
+_BATCH_GET_WORKERS = 8
+
 
 class S3StorageBackend(StorageBackend):
     """S3-compatible storage backend using boto3"""
@@ -388,6 +392,23 @@ class S3StorageBackend(StorageBackend):
             # Fallback to individual deletions
             return super().batch_delete(keys)
     
+    def batch_get_objects(self, keys: List[str]) -> Dict[str, StorageObject]:
+        """Get multiple objects, issuing the GET requests concurrently"""
+        if len(keys) <= 1:
+            return super().batch_get_objects(keys)
+        
+        def get_if_exists(key: str) -> Optional[StorageObject]:
+            try:
+                return self.get_object(key)
+            except StorageNotFoundError:
+                return None
+        
+        # boto3 clients are thread-safe, so the requests can share self.s3_client
+        with ThreadPoolExecutor(max_workers=min(_BATCH_GET_WORKERS, len(keys))) as executor:
+            objects = list(executor.map(get_if_exists, keys))
+        
+        return {key: obj for key, obj in zip(keys, objects) if obj is not None}
+    
     def list_object_versions(self, key: str) -> List[StorageObjectInfo]:
         """List all versions of an object"""
         try:
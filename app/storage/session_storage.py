@@ -162,6 +162,12 @@ class SessionStorage:
         obj = self.storage.get_object(key)
         return obj.content
     
+    def get_session_files(self, session_id: str, filenames: List[str]) -> Dict[str, str]:
+        """Get contents of several session files in one batch; missing files are omitted"""
+        keys = {self._get_session_key(session_id, filename): filename for filename in filenames}
+        objects = self.storage.batch_get_objects(list(keys))
+        return {keys[key]: obj.content for key, obj in objects.items()}
+    
     def session_file_exists(self, session_id: str, filename: str) -> bool:
         """Check if a session file exists"""
         key = self._get_session_key(session_id, filename)
@@ -1,9 +1,14 @@
 """Policy generation interface components."""
 
 import streamlit as st
-from typing import Optional, Dict, Any, Callable
+from pygments import highlight
+from pygments.formatters import HtmlFormatter
+from pygments.lexers import PythonLexer
+from typing import Optional, Dict, Any, Callable, Generator, Iterable, Iterator, List
 import time
 import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from ...models import Session, GeneratedPolicy
@@ -22,14 +27,83 @@ from .retry_handler import (
 )
 
 
-def initialize_policy_generator() -> SessionPolicyGenerator:
-    """Initialize and cache the policy generator."""
+class _ChunkStream:
+    """Iterable wrapper that keeps the return value of a policy chunk generator."""
+    
+    def __init__(self, chunks: Generator[str, None, PolicyGenerationResult]):
+        self._chunks = chunks
+        self.result: Optional[PolicyGenerationResult] = None
+    
+    def __iter__(self):
+        self.result = yield from self._chunks
+
+
+def _coalesce_chunks(chunks: Iterable[str], min_chars: int = 24, max_ms: float = 40) -> Iterator[str]:
+    """Group streamed chunks so the UI updates every min_chars characters or max_ms.
+    
+    The first chunk is flushed immediately so time-to-first-token is unchanged.
+    """
+    buffer = []
+    buffered_chars = 0
+    threshold = 1
+    last_flush = time.monotonic()
+    
+    for chunk in chunks:
+        buffer.append(chunk)
+        buffered_chars += len(chunk)
+        
+        if buffered_chars >= threshold or (time.monotonic() - last_flush) * 1000 >= max_ms:
+            yield ''.join(buffer)
+            buffer.clear()
+            buffered_chars = 0
+            threshold = min_chars
+            last_flush = time.monotonic()
+    
+    if buffer:
+        yield ''.join(buffer)
+
+
+def _fenced_policy_source(chunks: Iterable[str]) -> Iterator[str]:
+    """Wrap coalesced policy chunks in a plain-text code fence for st.write_stream.
+    
+    Without the fence, Markdown would turn Polar comments into headings and mangle
+    identifiers. A four-backtick fence survives ``` fences in the model output.
+    """
+    yield "````text\n"
+    yield from _coalesce_chunks(chunks)
+    yield "\n````"
+
+
+_GENERATION_MODELS = ["gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-3.5-turbo"]
+
+_DEFAULT_GENERATION_SETTINGS = {
+    "model": "gpt-4",
+    "temperature": 0.1,
+    "max_tokens": 2000,
+    "streaming": True
+}
+
+# History timeline entries shown per "Load older" page
+_HISTORY_PAGE_SIZE = 5
+
+# Shared pool for running policy validation off the script thread
+_VALIDATION_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="policy-validation")
+
+
+@st.cache_resource
+def _get_openai_service() -> SessionAwareOpenAIService:
+    """Get the shared OpenAI service, so all sessions reuse one client and its connection pool."""
+    return SessionAwareOpenAIService()
+
+
+def initialize_policy_generator() -> Optional[SessionPolicyGenerator]:
+    """Initialize and cache the policy generator, or return None if it cannot be created."""
     if "policy_generator" not in st.session_state:
         error_handler = create_error_handler()
         
         with error_boundary(error_handler, ErrorContext(component="PolicyGenerator")):
             # Initialize OpenAI service
-            openai_service = SessionAwareOpenAIService()
+            openai_service = _get_openai_service()
             
             # Initialize validator (optional)
             try:
@@ -52,10 +126,11 @@ def initialize_policy_generator() -> SessionPolicyGenerator:
                 validator=validator
             )
     
-    return st.session_state.policy_generator
+    return st.session_state.get("policy_generator")
 
 
-def render_generation_trigger(session: Session, session_manager: SessionManager) -> bool:
+def render_generation_trigger(session: Session, session_manager: SessionManager,
+                              policy_generator: Optional[SessionPolicyGenerator] = None) -> bool:
     """Render the policy generation trigger UI with progress indicators."""
     st.subheader("🔧 Policy Generation")
     
@@ -64,62 +139,83 @@ def render_generation_trigger(session: Session, session_manager: SessionManager)
         return False
     
     # Get generation settings
-    settings = _render_generation_settings()
+    _render_generation_settings()
+    settings = st.session_state["gen_settings"]
     
     # Get generation buttons state
-    buttons = _render_generation_buttons(session)
+    has_errors = _has_validation_errors(session)
+    buttons = _render_generation_buttons(session, has_errors)
     
     # Handle generation triggers
-    return _handle_generation_triggers(session, session_manager, settings, buttons)
+    if not any(buttons.values()):
+        return False
+    
+    policy_generator = policy_generator or initialize_policy_generator()
+    return _handle_generation_triggers(session, session_manager, policy_generator, settings, buttons, has_errors)
 
 
-def _render_generation_settings() -> dict:
-    """Render generation settings UI and return configuration."""
+@st.fragment
+def _render_generation_settings() -> None:
+    """Render generation settings UI and store the applied configuration in session state.
+    
+    The widgets sit in a form inside a fragment, so changing them does not rerun
+    anything until "Apply" is pressed, and applying only reruns this panel.
+    """
+    settings = st.session_state.setdefault("gen_settings", dict(_DEFAULT_GENERATION_SETTINGS))
+    
     with st.expander("⚙️ Generation Settings", expanded=False):
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            model = st.selectbox(
-                "Model",
-                options=["gpt-4", "gpt-4-turbo", "gpt-4o", "gpt-3.5-turbo"],
-                index=0,
-                help="Select the OpenAI model to use for generation"
-            )
+        with st.form("gen_settings_form", border=False):
+            col1, col2 = st.columns(2)
             
-            temperature = st.slider(
-                "Temperature",
-                min_value=0.0,
-                max_value=1.0,
-                value=0.1,
-                step=0.1,
-                help="Controls randomness in generation"
-            )
-        
-        with col2:
-            max_tokens = st.number_input(
-                "Max Tokens",
-                min_value=100,
-                max_value=4000,
-                value=2000,
-                step=100,
-                help="Maximum number of tokens to generate"
-            )
+            with col1:
+                model = st.selectbox(
+                    "Model",
+                    options=_GENERATION_MODELS,
+                    index=_GENERATION_MODELS.index(settings["model"]),
+                    help="Select the OpenAI model to use for generation",
+                    key="gen_settings_model"
+                )
+                
+                temperature = st.slider(
+                    "Temperature",
+                    min_value=0.0,
+                    max_value=1.0,
+                    value=settings["temperature"],
+                    step=0.1,
+                    help="Controls randomness in generation",
+                    key="gen_settings_temperature"
+                )
             
-            streaming = st.checkbox(
-                "Enable Streaming",
-                value=True,
-                help="Show generation progress in real-time"
-            )
+            with col2:
+                max_tokens = st.number_input(
+                    "Max Tokens",
+                    min_value=100,
+                    max_value=4000,
+                    value=settings["max_tokens"],
+                    step=100,
+                    help="Maximum number of tokens to generate",
+                    key="gen_settings_max_tokens"
+                )
+                
+                streaming = st.checkbox(
+                    "Enable Streaming",
+                    value=settings["streaming"],
+                    help="Show generation progress in real-time",
+                    key="gen_settings_streaming"
+                )
+            
+            submitted = st.form_submit_button("Apply")
     
-    return {
-        "model": model,
-        "temperature": temperature,
-        "max_tokens": max_tokens,
-        "streaming": streaming
-    }
+    if submitted:
+        st.session_state["gen_settings"] = {
+            "model": model,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "streaming": streaming
+        }
 
 
-def _render_generation_buttons(session: Session) -> dict:
+def _render_generation_buttons(session: Session, has_errors: bool) -> dict:
     """Render generation buttons and return their states."""
     col1, col2, col3 = st.columns([2, 1, 1])
     
@@ -128,26 +224,28 @@ def _render_generation_buttons(session: Session) -> dict:
             "🚀 Generate Policy",
             type="primary",
             help="Generate a new Polar policy from requirements",
-            disabled=not session.requirements_text.strip()
+            disabled=not session.requirements_text.strip(),
+            key=f"gen_{session.id}"
         )
     
     with col2:
-        has_validation_errors = _has_validation_errors(session)
         retry_button = st.button(
             "🔄 Retry with Errors",
             help="Retry generation using validation errors as context",
-            disabled=not has_validation_errors
+            disabled=not has_errors,
+            key=f"retry_{session.id}"
         )
     
     with col3:
         regenerate_button = st.button(
             "⚡ Quick Regenerate",
-            help="Generate a new policy with the same settings"
+            help="Generate a new policy with the same settings",
+            key=f"regen_{session.id}"
         )
     
     return {
         "generate": generate_button,
-        "retry": retry_button and has_validation_errors,
+        "retry": retry_button,
         "regenerate": regenerate_button
     }
 
@@ -159,28 +257,36 @@ def _has_validation_errors(session: Session) -> bool:
         return False
     
     latest_validation = session.get_latest_validation(current_policy.id)
-    return latest_validation and not latest_validation.is_valid
+    return bool(latest_validation and not latest_validation.is_valid)
 
 
-def _handle_generation_triggers(session: Session, session_manager: SessionManager, 
-                              settings: dict, buttons: dict) -> bool:
+def _handle_generation_triggers(session: Session, session_manager: SessionManager,
+                              policy_generator: Optional[SessionPolicyGenerator],
+                              settings: dict, buttons: dict, has_errors: bool) -> bool:
     """Handle generation button triggers."""
     if buttons["generate"] or buttons["regenerate"]:
-        return _handle_policy_generation(session, session_manager, **settings)
+        return _handle_policy_generation(session, session_manager, policy_generator, **settings)
     
-    elif buttons["retry"]:
-        return _handle_retry_generation(session, session_manager, **settings)
+    elif buttons["retry"] and has_errors:
+        return _handle_retry_generation(session, session_manager, policy_generator, **settings)
     
     return False
 
 
-def render_policy_display(session: Session, session_manager: SessionManager) -> None:
+@st.fragment
+def render_policy_display(session: Session, session_manager: SessionManager,
+                          policy_generator: Optional[SessionPolicyGenerator] = None,
+                          policies_newest_first: Optional[List[GeneratedPolicy]] = None) -> None:
     """
     Render the policy display component with syntax highlighting.
     
+    Runs as a fragment so its widgets only rerun this section.
+    
     Args:
         session: Current session
         session_manager: SessionManager instance
+        policy_generator: Policy generator to validate with (initialized on demand if omitted)
+        policies_newest_first: Session policies in reverse generation order (derived if omitted)
     """
     if not session.generated_policies:
         st.info("📝 No policies have been generated yet. Use the generation controls above to create your first policy.")
@@ -197,22 +303,24 @@ def render_policy_display(session: Session, session_manager: SessionManager) ->
         current_policy.is_current = True
     
     if len(session.generated_policies) > 1:
-        policy_options = []
-        for i, policy in enumerate(reversed(session.generated_policies)):
-            timestamp = policy.generated_at.strftime("%Y-%m-%d %H:%M:%S")
-            label = f"Policy {len(session.generated_policies) - i} - {policy.model_used} ({timestamp})"
-            policy_options.append((label, policy.id))
+        if policies_newest_first is None:
+            policies_newest_first = session.generated_policies[::-1]
+        total = len(policies_newest_first)
+        policy_options = {
+            f"Policy {total - i} - {_policy_label(policy.id, policy.generated_at, policy.model_used)}": policy.id
+            for i, policy in enumerate(policies_newest_first)
+        }
         
         selected_label = st.selectbox(
             "Select Policy Version",
-            options=[label for label, _ in policy_options],
+            options=list(policy_options),
             index=0,
-            help="Choose which policy version to display"
+            help="Choose which policy version to display",
+            key=f"policy_select_{session.id}"
         )
         
         # Find selected policy
-        selected_policy_id = next(pid for label, pid in policy_options if label == selected_label)
-        current_policy = next(p for p in session.generated_policies if p.id == selected_policy_id)
+        current_policy = session.get_policy(policy_options[selected_label])
     
     if current_policy:
         # Policy metadata
@@ -240,24 +348,29 @@ def render_policy_display(session: Session, session_manager: SessionManager) ->
         col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
         
         with col1:
-            if st.button("📋 Copy Policy", help="Copy policy content to clipboard"):
+            if st.button("📋 Copy Policy", help="Copy policy content to clipboard",
+                         key=f"copy_{current_policy.id}"):
                 st.info("💡 Use Ctrl+A, Ctrl+C to copy the policy content below")
         
         with col2:
-            if st.button("💾 Download", help="Download policy as .polar file"):
-                st.download_button(
-                    label="📥 Download .polar",
-                    data=current_policy.content,
-                    file_name=f"policy_{current_policy.id[:8]}.polar",
-                    mime="text/plain"
-                )
+            st.download_button(
+                label="💾 Download .polar",
+                data=_policy_bytes(current_policy.id, current_policy.content),
+                file_name=f"policy_{current_policy.id[:8]}.polar",
+                mime="text/plain",
+                help="Download policy as .polar file",
+                key=f"download_{current_policy.id}"
+            )
         
         with col3:
-            if st.button("✅ Validate", help="Validate this policy"):
-                _handle_policy_validation(current_policy, session, session_manager)
+            if st.button("✅ Validate", help="Validate this policy", key=f"validate_{current_policy.id}"):
+                _handle_policy_validation(
+                    current_policy, session, policy_generator or initialize_policy_generator()
+                )
         
         with col4:
-            if st.button("🗑️ Delete", help="Delete this policy version", type="secondary"):
+            if st.button("🗑️ Delete", help="Delete this policy version", type="secondary",
+                         key=f"delete_{current_policy.id}"):
                 st.session_state.show_delete_policy_dialog = current_policy.id
         
         # Delete confirmation dialog
@@ -268,18 +381,23 @@ def render_policy_display(session: Session, session_manager: SessionManager) ->
                 
                 col1, col2 = st.columns(2)
                 with col1:
-                    if st.button("❌ Yes, Delete", type="primary"):
+                    if st.button("❌ Yes, Delete", type="primary", key=f"confirm_delete_{current_policy.id}"):
                         _handle_policy_deletion(current_policy, session, session_manager)
                         st.session_state.show_delete_policy_dialog = None
                         st.rerun()
                 
                 with col2:
-                    if st.button("Cancel"):
+                    if st.button("Cancel", key=f"cancel_delete_{current_policy.id}"):
                         st.session_state.show_delete_policy_dialog = None
                         st.rerun()
         
         # Display policy with syntax highlighting
-        st.code(current_policy.content, language="python", line_numbers=True)
+        st.markdown(_render_highlighted(current_policy.id, current_policy.content), unsafe_allow_html=True)
+        
+        # Background validation progress for current policy; the polling fragment is
+        # only rendered while a validation is pending, so idle viewers don't rerun
+        if f"val_fut_{current_policy.id}" in st.session_state:
+            _render_validation_progress(current_policy, session, session_manager)
         
         # Validation status for current policy
         latest_validation = session.get_latest_validation(current_policy.id)
@@ -294,27 +412,40 @@ def render_policy_display(session: Session, session_manager: SessionManager) ->
                     st.code(latest_validation.error_message, language="text")
 
 
-def render_generation_history(session: Session) -> None:
+@st.fragment
+def render_generation_history(session: Session, session_manager: SessionManager,
+                              policy_generator: Optional[SessionPolicyGenerator] = None,
+                              policies_newest_first: Optional[List[GeneratedPolicy]] = None) -> None:
     """
     Render the generation history and version management UI.
     
+    Runs as a fragment so unrelated widget changes do not re-render the history.
+    
     Args:
         session: Current session
+        session_manager: SessionManager instance
+        policy_generator: Policy generator to validate with (initialized on demand if omitted)
+        policies_newest_first: Session policies in reverse generation order (derived if omitted)
     """
     if not session.generated_policies:
         st.info("📊 No generation history available yet.")
         return
     
+    if policies_newest_first is None:
+        policies_newest_first = session.generated_policies[::-1]
+    
     st.markdown("---")
     st.subheader("📊 Generation History")
     
     # Generation statistics
     col1, col2, col3, col4 = st.columns(4)
     
-    total_policies = len(session.generated_policies)
-    total_tokens = sum(p.tokens_used or 0 for p in session.generated_policies)
-    total_time = sum(p.generation_time for p in session.generated_policies)
-    avg_time = total_time / total_policies if total_policies > 0 else 0
+    policy_stats = tuple(
+        (p.id, p.tokens_used, p.generation_time, p.model_used) for p in session.generated_policies
+    )
+    total_policies, total_tokens, total_time, avg_time, models_used = _history_stats(
+        session.id, session.version, policy_stats
+    )
     
     with col1:
         st.metric("Total Generations", total_policies)
@@ -329,47 +460,142 @@ def render_generation_history(session: Session) -> None:
         st.metric("Avg Time", f"{avg_time:.1f}s")
     
     # Models used
-    models_used = list(set(p.model_used for p in session.generated_policies))
     if models_used:
         st.markdown(f"**Models Used:** {', '.join(models_used)}")
     
     # Generation timeline
     st.markdown("### 📈 Generation Timeline")
     
-    # Create a simple timeline view
-    for i, policy in enumerate(reversed(session.generated_policies)):
-        policy_num = len(session.generated_policies) - i
+    pending_policies = [p for p in session.generated_policies if not session.get_latest_validation(p.id)]
+    if st.button(
+        "✅ Validate All",
+        help="Validate every policy that has not been validated yet",
+        disabled=not pending_policies,
+        key=f"validate_all_{session.id}"
+    ):
+        _handle_validate_all(
+            pending_policies, session, session_manager, policy_generator or initialize_policy_generator()
+        )
+    
+    timeline = _history_timeline(
+        session.id,
+        session.version,
+        tuple((p.id, p.model_used, p.generated_at) for p in policies_newest_first),
+        tuple(p.content for p in policies_newest_first)
+    )
+    
+    # Create a simple timeline view; only the opened entry renders its details
+    open_key = f"history_open_{session.id}"
+    limit_key = f"history_limit_{session.id}"
+    limit = st.session_state.setdefault(limit_key, _HISTORY_PAGE_SIZE)
+    
+    for policy_id, title, preview in timeline[:limit]:
+        is_open = st.session_state.get(open_key) == policy_id
         
-        with st.expander(
-            f"Policy {policy_num} - {policy.model_used} ({policy.generated_at.strftime('%Y-%m-%d %H:%M:%S')})",
-            expanded=False
-        ):
-            col1, col2 = st.columns([2, 1])
-            
-            with col1:
-                # Policy preview (first 200 characters)
-                preview = policy.content[:200] + "..." if len(policy.content) > 200 else policy.content
-                st.code(preview, language="python")
+        st.button(
+            f"{'▾' if is_open else '▸'} {title}",
+            key=f"history_{policy_id}",
+            use_container_width=True,
+            on_click=_set_state,
+            args=(open_key, None if is_open else policy_id)
+        )
+        
+        if is_open:
+            _render_history_entry(session.get_policy(policy_id), preview, session)
+    
+    if len(timeline) > limit:
+        st.button(
+            f"Load older ({len(timeline) - limit} more)",
+            key=f"history_more_{session.id}",
+            on_click=_set_state,
+            args=(limit_key, limit + _HISTORY_PAGE_SIZE)
+        )
+
+
+def _set_state(key: str, value: Any) -> None:
+    """Widget callback that stores a value in session state before the rerun."""
+    st.session_state[key] = value
+
+
+def _render_history_entry(policy: GeneratedPolicy, preview: str, session: Session) -> None:
+    """Render the preview and metadata of one history timeline entry."""
+    with st.container(border=True):
+        col1, col2 = st.columns([2, 1])
+        
+        with col1:
+            # Policy preview (first 200 characters)
+            st.markdown(
+                _render_highlighted(f"{policy.id}:preview", preview, line_numbers=False),
+                unsafe_allow_html=True
+            )
+        
+        with col2:
+            st.write(f"**Model:** {policy.model_used}")
+            if policy.tokens_used:
+                st.write(f"**Tokens:** {policy.tokens_used:,}")
+            st.write(f"**Time:** {policy.generation_time:.2f}s")
+            st.write(f"**Current:** {'Yes' if policy.is_current else 'No'}")
             
-            with col2:
-                st.write(f"**Model:** {policy.model_used}")
-                if policy.tokens_used:
-                    st.write(f"**Tokens:** {policy.tokens_used:,}")
-                st.write(f"**Time:** {policy.generation_time:.2f}s")
-                st.write(f"**Current:** {'Yes' if policy.is_current else 'No'}")
-                
-                # Validation status
-                validation = session.get_latest_validation(policy.id)
-                if validation:
-                    status = "✅ Valid" if validation.is_valid else "❌ Invalid"
-                    st.write(f"**Validation:** {status}")
+            # Validation status
+            validation = session.get_latest_validation(policy.id)
+            if validation:
+                status = "✅ Valid" if validation.is_valid else "❌ Invalid"
+                st.write(f"**Validation:** {status}")
+
+
+@functools.lru_cache(maxsize=512)
+def _policy_label(policy_id: str, generated_at: datetime, model_used: str) -> str:
+    """Format the "model (timestamp)" part of a policy version label."""
+    return f"{model_used} ({generated_at.strftime('%Y-%m-%d %H:%M:%S')})"
 
 
-def _handle_policy_generation(session: Session, session_manager: SessionManager, 
+@st.cache_data(show_spinner=False)
+def _history_stats(session_id: str, version: int, policies: tuple) -> tuple:
+    """Aggregate (total, tokens, time, average time, models) over policy stat tuples."""
+    total_policies = len(policies)
+    total_tokens = sum(tokens or 0 for _, tokens, _, _ in policies)
+    total_time = sum(generation_time for _, _, generation_time, _ in policies)
+    avg_time = total_time / total_policies if total_policies > 0 else 0
+    models_used = list(set(model for _, _, _, model in policies))
+    return total_policies, total_tokens, total_time, avg_time, models_used
+
+
+@st.cache_data(show_spinner=False)
+def _history_timeline(session_id: str, version: int, policies: tuple, _contents: tuple) -> list:
+    """Build (policy_id, title, preview) timeline rows from newest-first policies.
+    
+    Policy content never changes once generated, so it is left out of the cache key.
+    """
+    rows = []
+    for i, ((policy_id, model_used, generated_at), content) in enumerate(zip(policies, _contents)):
+        title = f"Policy {len(policies) - i} - {_policy_label(policy_id, generated_at, model_used)}"
+        preview = content[:200] + "..." if len(content) > 200 else content
+        rows.append((policy_id, title, preview))
+    return rows
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _render_highlighted(cache_key: str, _content: str, line_numbers: bool = True) -> str:
+    """Syntax-highlight policy content to HTML.
+    
+    Keyed on the policy ID rather than the content, which never changes once generated.
+    """
+    formatter = HtmlFormatter(linenos="inline" if line_numbers else False, noclasses=True)
+    html = highlight(_content, PythonLexer(), formatter)
+    return f'<div style="overflow-x: auto">{html}</div>'
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _policy_bytes(policy_id: str, _content: str) -> bytes:
+    """Encode policy content for download once per policy."""
+    return _content.encode("utf-8")
+
+
+def _handle_policy_generation(session: Session, session_manager: SessionManager,
+                            policy_generator: Optional[SessionPolicyGenerator],
                             model: str, temperature: float, max_tokens: int, 
                             streaming: bool) -> bool:
     """Handle policy generation request."""
-    policy_generator = initialize_policy_generator()
     if not policy_generator:
         return False
     
@@ -385,18 +611,15 @@ def _handle_policy_generation(session: Session, session_manager: SessionManager,
 def _execute_generation(policy_generator: SessionPolicyGenerator, request: PolicyGenerationRequest,
                        session: Session, session_manager: SessionManager, streaming: bool) -> bool:
     """Execute policy generation with progress tracking and error handling."""
-    progress_placeholder = st.empty()
-    content_placeholder = st.empty()
     error_handler = create_error_handler()
     
     def generation_operation():
         if streaming:
-            generated_content = []
-            def stream_callback(chunk: str):
-                generated_content.append(chunk)
-                content_placeholder.code(''.join(generated_content), language="text")
-            
-            return policy_generator.generate_policy_stream(request, session, stream_callback)
+            # Clear any partial output left by a failed previous attempt
+            preview_placeholder.empty()
+            stream = _ChunkStream(policy_generator.iter_chunks(request, session))
+            preview_placeholder.write_stream(_fenced_policy_source(stream))
+            return stream.result
         else:
             return policy_generator.generate_policy(request, session)
     
@@ -408,57 +631,55 @@ def _execute_generation(policy_generator: SessionPolicyGenerator, request: Polic
         show_progress=False  # We handle progress ourselves
     )
     
-    try:
-        progress_placeholder.info("🔄 Generating policy...")
-        
-        retry_handler = create_retry_handler()
-        success, result = retry_handler.retry_with_ui(
-            operation=generation_operation,
-            operation_name="Policy Generation",
-            config=retry_config,
-            context=ErrorContext(
-                session_id=session.id,
-                user_action="Policy Generation",
-                component="PolicyGenerator"
-            ),
-            container=st.empty()  # Use empty container to avoid duplicate messages
-        )
+    with st.status("🔄 Generating policy...", expanded=True) as status:
+        # One preview shared by all retry attempts, so they don't stack up
+        preview_placeholder = st.empty()
+        try:
+            retry_handler = create_retry_handler()
+            success, result = retry_handler.retry_with_ui(
+                operation=generation_operation,
+                operation_name="Policy Generation",
+                config=retry_config,
+                context=ErrorContext(
+                    session_id=session.id,
+                    user_action="Policy Generation",
+                    component="PolicyGenerator"
+                ),
+                container=st.empty()  # Use empty container to avoid duplicate messages
+            )
+            
+            if success and result:
+                return _handle_generation_result(result, session, session_manager, status)
+            else:
+                status.update(label="❌ Policy generation failed after retries", state="error")
+                return False
         
-        if success and result:
-            return _handle_generation_result(result, session, session_manager, progress_placeholder, content_placeholder)
-        else:
-            progress_placeholder.error("❌ Policy generation failed after retries")
-            content_placeholder.empty()
+        except Exception as e:
+            handle_generation_error(e, session.id, error_handler)
+            status.update(label="❌ Unexpected generation error occurred", state="error")
             return False
-    
-    except Exception as e:
-        handle_generation_error(e, session.id, error_handler)
-        progress_placeholder.error("❌ Unexpected generation error occurred")
-        content_placeholder.empty()
-        return False
 
 
 def _handle_generation_result(result: PolicyGenerationResult, session: Session, 
-                            session_manager: SessionManager, progress_placeholder, content_placeholder) -> bool:
+                            session_manager: SessionManager, status) -> bool:
     """Handle the result of policy generation."""
     if result.is_successful():
-        progress_placeholder.success(f"✅ Policy generated successfully! ({result.generation_time:.2f}s)")
         session_manager.save_session(session)
         
-        time.sleep(2)
-        content_placeholder.empty()
+        # Toasts survive the rerun that follows, so no need to hold the script here
+        st.toast(f"Policy generated successfully! ({result.generation_time:.2f}s)", icon="✅")
+        status.update(label="✅ Policy generated", state="complete", expanded=False)
         return True
     else:
-        progress_placeholder.error(f"❌ Generation failed: {result.error_message}")
-        content_placeholder.empty()
+        status.update(label=f"❌ Generation failed: {result.error_message}", state="error")
         return False
 
 
 def _handle_retry_generation(session: Session, session_manager: SessionManager,
+                           policy_generator: Optional[SessionPolicyGenerator],
                            model: str, temperature: float, max_tokens: int,
                            streaming: bool) -> bool:
     """Handle retry generation with validation errors."""
-    policy_generator = initialize_policy_generator()
     if not policy_generator:
         return False
     
@@ -497,45 +718,56 @@ def _execute_retry_generation(policy_generator: SessionPolicyGenerator, request:
                             session: Session, session_manager: SessionManager, streaming: bool,
                             validation_errors: list[str]) -> bool:
     """Execute retry generation with progress tracking."""
-    progress_placeholder = st.empty()
-    content_placeholder = st.empty()
-    
-    try:
-        progress_placeholder.info("🔄 Retrying policy generation with error context...")
-        
-        if streaming:
-            generated_content = []
-            def stream_callback(chunk: str):
-                generated_content.append(chunk)
-                content_placeholder.code(''.join(generated_content), language="text")
+    with st.status("🔄 Retrying policy generation with error context...", expanded=True) as status:
+        try:
+            if streaming:
+                stream = _ChunkStream(policy_generator.iter_retry_chunks(session, validation_errors))
+                st.write_stream(_fenced_policy_source(stream))
+                result = stream.result
+            else:
+                result = policy_generator.retry_policy_generation(session, validation_errors)
             
-            result = policy_generator.retry_policy_generation_stream(session, validation_errors, stream_callback)
-        else:
-            result = policy_generator.retry_policy_generation(session, validation_errors)
+            return _handle_generation_result(result, session, session_manager, status)
         
-        return _handle_generation_result(result, session, session_manager, progress_placeholder, content_placeholder)
+        except Exception as e:
+            status.update(label=f"❌ Retry generation error: {str(e)}", state="error")
+            return False
+
+
+def _handle_policy_validation(policy: GeneratedPolicy, session: Session,
+                            policy_generator: Optional[SessionPolicyGenerator]) -> None:
+    """Start validating a policy in the background."""
+    future_key = f"val_fut_{policy.id}"
+    if future_key in st.session_state or not policy_generator:
+        return
     
-    except Exception as e:
-        progress_placeholder.error(f"❌ Retry generation error: {str(e)}")
-        content_placeholder.empty()
-        return False
+    st.session_state[future_key] = _VALIDATION_EXECUTOR.submit(
+        policy_generator.validate_policy, policy.content, policy.id, session.id
+    )
 
 
-def _handle_policy_validation(policy: GeneratedPolicy, session: Session, 
-                            session_manager: SessionManager) -> None:
-    """Handle policy validation request with error handling and retry."""
-    policy_generator = initialize_policy_generator()
-    if not policy_generator:
+@st.fragment(run_every=1)
+def _render_validation_progress(policy: GeneratedPolicy, session: Session,
+                                session_manager: SessionManager) -> None:
+    """Poll a pending background validation and record its result once finished.
+    
+    Only call this while a future is pending; the final pass reruns the page,
+    after which the caller stops rendering the fragment.
+    """
+    future_key = f"val_fut_{policy.id}"
+    future = st.session_state.get(future_key)
+    if future is None:
         return
     
-    progress_placeholder = st.empty()
+    if not future.done():
+        st.info("🔄 Validating policy...")
+        return
+    
+    del st.session_state[future_key]
     error_handler = create_error_handler()
     
-    def validation_operation():
-        # Validate the policy
-        validation_result = policy_generator.validate_policy(
-            policy.content, policy.id, session.id
-        )
+    try:
+        validation_result = future.result()
         
         # Create validation result and add to session
         from ...models.session import ValidationResult
@@ -548,69 +780,66 @@ def _handle_policy_validation(policy: GeneratedPolicy, session: Session,
         
         session.add_validation_result(result)
         session_manager.save_session(session)
-        
-        return validation_result
     
-    # Use retry mechanism for validation
-    retry_config = RetryConfig(
-        max_attempts=2,
-        strategy=RetryStrategy.FIXED_DELAY,
-        base_delay=1.0,
-        show_progress=False  # We handle progress ourselves
-    )
+    except Exception as e:
+        handle_validation_error(e, policy.id, session.id, error_handler)
+        st.error("❌ Unexpected validation error occurred")
+        return
     
-    try:
-        progress_placeholder.info("🔄 Validating policy...")
-        
-        retry_handler = create_retry_handler()
-        success, validation_result = retry_handler.retry_with_ui(
-            operation=validation_operation,
-            operation_name="Policy Validation",
-            config=retry_config,
-            context=ErrorContext(
-                session_id=session.id,
-                user_action="Policy Validation",
-                component="PolarValidator",
-                additional_data={"policy_id": policy.id}
-            ),
-            container=st.empty()  # Use empty container to avoid duplicate messages
-        )
+    # Refresh the whole page so the validation status and retry controls update
+    st.rerun()
+
+
+async def _validate_all(policy_generator: SessionPolicyGenerator, policies: list[GeneratedPolicy],
+                        session_id: str) -> list:
+    """Validate several policies concurrently on the shared pool; failures are returned as exceptions."""
+    tasks = [
+        policy_generator.validate_policy_async(policy.content, policy.id, session_id, _VALIDATION_EXECUTOR)
+        for policy in policies
+    ]
+    return await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _handle_validate_all(policies: list[GeneratedPolicy], session: Session,
+                         session_manager: SessionManager,
+                         policy_generator: Optional[SessionPolicyGenerator]) -> None:
+    """Validate all given policies at once and record their results."""
+    if not policy_generator:
+        return
+    
+    error_handler = create_error_handler()
+    
+    from ...models.session import ValidationResult
+    with st.spinner(f"🔄 Validating {len(policies)} policies..."):
+        results = asyncio.run(_validate_all(policy_generator, policies, session.id))
+    
+    for policy, validation_result in zip(policies, results):
+        if isinstance(validation_result, Exception):
+            handle_validation_error(validation_result, policy.id, session.id, error_handler)
+            continue
         
-        if success and validation_result:
-            if validation_result.is_valid:
-                progress_placeholder.success(f"✅ Policy validation passed! ({validation_result.validation_time:.2f}s)")
-            else:
-                progress_placeholder.error(f"❌ Policy validation failed ({validation_result.validation_time:.2f}s)")
-                
-                # Show validation errors with retry option
-                with st.expander("🔍 Validation Error Details", expanded=True):
-                    st.code(validation_result.error_message, language="text")
-                    
-                    if st.button("🔄 Retry Generation with Error Context", key=f"retry_validation_{policy.id}"):
-                        st.info("💡 Use the 'Retry with Errors' button in the generation section to fix these issues")
-        else:
-            progress_placeholder.error("❌ Policy validation failed after retries")
+        session.add_validation_result(ValidationResult.create(
+            policy_id=policy.id,
+            is_valid=validation_result.is_valid,
+            error_message=validation_result.error_message,
+            validation_time=validation_result.validation_time
+        ))
     
-    except Exception as e:
-        handle_validation_error(e, policy.id, session.id, error_handler)
-        progress_placeholder.error("❌ Unexpected validation error occurred")
+    try:
+        session_manager.save_session(session)
+    except SessionManagerError as e:
+        st.error(f"❌ Failed to save validation results: {str(e)}")
+        return
+    
+    st.rerun()
 
 
 def _handle_policy_deletion(policy: GeneratedPolicy, session: Session, 
                           session_manager: SessionManager) -> None:
     """Handle policy deletion."""
     try:
-        # Remove policy from session
-        session.generated_policies = [p for p in session.generated_policies if p.id != policy.id]
-        
-        # Remove associated validation results
-        session.validation_results = [r for r in session.validation_results if r.policy_id != policy.id]
-        
-        # If this was the current policy, make the latest remaining policy current
-        if policy.is_current and session.generated_policies:
-            session.generated_policies[-1].is_current = True
-        
-        session.update_timestamp()
+        # Remove policy and its validation results from session
+        session.remove_policy(policy.id)
         session_manager.save_session(session)
         
         st.success("✅ Policy deleted successfully")
@@ -619,24 +848,30 @@ def _handle_policy_deletion(policy: GeneratedPolicy, session: Session,
         st.error(f"❌ Failed to delete policy: {str(e)}")
 
 
-def render_policy_generation_interface(session: Session, session_manager: SessionManager) -> None:
+def render_policy_generation_interface(session: Session, session_manager: SessionManager,
+                                       policy_generator: Optional[SessionPolicyGenerator] = None) -> None:
     """
     Render the complete policy generation interface.
     
     Args:
         session: Current session
         session_manager: SessionManager instance
+        policy_generator: Policy generator to use (defaults to the cached instance)
     """
+    policy_generator = policy_generator or initialize_policy_generator()
+    
     # Generation trigger section
-    generation_triggered = render_generation_trigger(session, session_manager)
+    generation_triggered = render_generation_trigger(session, session_manager, policy_generator)
+    
+    # Shared by the display and history sections
+    policies_newest_first = session.generated_policies[::-1]
     
     # Policy display section
-    render_policy_display(session, session_manager)
+    render_policy_display(session, session_manager, policy_generator, policies_newest_first)
     
     # Generation history section
-    render_generation_history(session)
+    render_generation_history(session, session_manager, policy_generator, policies_newest_first)
     
     # If generation was triggered, refresh the page to show new content
     if generation_triggered:
-        time.sleep(1)  # Brief delay to show success message
         st.rerun()
\ No newline at end of file
@@ -1,17 +1,110 @@
 """Requirements input interface components."""
 
 import streamlit as st
-from typing import Optional, Tuple
-import time
-from datetime import datetime
+import numpy as np
+from typing import Optional, NamedTuple, Mapping
+from types import MappingProxyType
+from importlib import resources
+import json
+import re
 
 from ...models import Session
 from ...services.session_manager import SessionManager, SessionManagerError
 
 
+class RequirementsAnalysis(NamedTuple):
+    """Read-only metrics and quality indicators for a requirements text."""
+    char_count: int
+    word_count: int
+    line_count: int
+    paragraphs: int
+    bullet_count: int
+    reading_time: int
+    has_user_story: bool
+    has_criteria: bool
+    has_structured: bool
+    sufficient_detail: bool
+
+
+# Whole-word markers of structured (SHALL/WHEN/THEN style) requirements and user stories
+_QUALITY_RE = re.compile(r"\b(shall|must|should|when|then)\b", re.IGNORECASE)
+_USER_STORY_RE = re.compile(r"\bas an?\b", re.IGNORECASE)
+
+_PLACEHOLDER = """Enter your requirements here. For example:
+
+As a user, I want to be able to authenticate with the system, so that I can access protected resources.
+
+Acceptance Criteria:
+- Users must be able to log in with email and password
+- Invalid credentials should show appropriate error messages
+- Successful login should redirect to the dashboard
+- Session should expire after 24 hours of inactivity
+
+Additional Requirements:
+- Support for password reset functionality
+- Two-factor authentication for enhanced security
+- Remember me option for convenience"""
+
+# Below this size str.split() is as fast as the vectorized word count
+_VECTORIZE_MIN_CHARS = 64 * 1024
+
+# Lookup table of the ASCII bytes str.split() treats as whitespace
+_ASCII_WHITESPACE = np.zeros(256, dtype=bool)
+_ASCII_WHITESPACE[[0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20]] = True
+
+
+@st.cache_resource
+def _load_templates() -> Mapping[str, str]:
+    """Load the requirements templates shipped with the package, once per process."""
+    data = resources.files(__package__).joinpath("templates/requirements.json").read_text(encoding="utf-8")
+    return MappingProxyType(json.loads(data))
+
+
+def _count_words(text: str) -> int:
+    """Count whitespace-separated words, vectorizing the scan for large ASCII documents."""
+    if len(text) < _VECTORIZE_MIN_CHARS or not text.isascii():
+        return len(text.split())
+    
+    is_space = _ASCII_WHITESPACE[np.frombuffer(text.encode("ascii"), dtype=np.uint8)]
+    # A word starts at every non-space byte that follows a space (or starts the text)
+    return int(not is_space[0]) + int(np.count_nonzero(is_space[:-1] & ~is_space[1:]))
+
+
+def _count_paragraphs(text: str) -> int:
+    """Count paragraphs separated by empty lines, skipping whitespace-only ones."""
+    return sum(1 for para in text.split('\n\n') if para and not para.isspace())
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _analyze_requirements(text: str) -> RequirementsAnalysis:
+    """Compute read-only requirements metrics and quality indicators for the given text."""
+    lower = text.lower()
+    word_count = _count_words(text)
+    
+    return RequirementsAnalysis(
+        char_count=len(text),
+        word_count=word_count,
+        line_count=text.count('\n') + 1,
+        paragraphs=_count_paragraphs(text),
+        bullet_count=text.count('- ') + text.count('* '),
+        # Estimated reading time (average 200 words per minute)
+        reading_time=max(1, word_count // 200),
+        has_user_story=_USER_STORY_RE.search(text) is not None,
+        has_criteria="acceptance criteria" in lower or "criteria:" in lower,
+        has_structured=_QUALITY_RE.search(text) is not None,
+        sufficient_detail=word_count > 50
+    )
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _decode_upload(data: bytes, name: str) -> str:
+    """Decode an uploaded requirements file once per distinct upload."""
+    return data.decode('utf-8')
+
+
 def render_requirements_editor(session: Session, session_manager: SessionManager) -> bool:
     """
-    Render the requirements input interface with auto-save functionality.
+    Render the requirements input interface.
     
     Args:
         session: Current session
@@ -22,6 +115,9 @@ def render_requirements_editor(session: Session, session_manager: SessionManager
     """
     st.subheader("📝 Requirements Input")
     
+    # Per-session editor bookkeeping: uploader generation and text staged for the editor
+    editor_state = st.session_state.setdefault("_editor_state", {}).setdefault(session.id, {"upload_count": 0})
+    
     # File upload section
     st.markdown("### 📁 Import Requirements")
     
@@ -32,7 +128,7 @@ def render_requirements_editor(session: Session, session_manager: SessionManager
             "Upload requirements document",
             type=['txt', 'md', 'mdx'],
             help="Upload a text file containing your requirements",
-            key="requirements_file_upload"
+            key=f"requirements_file_upload_{session.id}_{editor_state['upload_count']}"
         )
     
     with col2:
@@ -40,7 +136,7 @@ def render_requirements_editor(session: Session, session_manager: SessionManager
             if st.button("📥 Load File", type="primary"):
                 try:
                     # Read file content
-                    file_content = uploaded_file.read().decode('utf-8')
+                    file_content = _decode_upload(uploaded_file.getvalue(), uploaded_file.name)
                     
                     # Update session requirements
                     session.requirements_text = file_content
@@ -49,16 +145,14 @@ def render_requirements_editor(session: Session, session_manager: SessionManager
                     # Save to storage
                     session_manager.save_session(session)
                     
-                    st.success(f"✅ Loaded {len(file_content)} characters from {uploaded_file.name}")
-                    
-                    # Clear the file uploader
-                    st.session_state.requirements_file_upload = None
+                    st.toast(f"✅ Loaded {len(file_content)} characters from {uploaded_file.name}")
                     
-                    # Force refresh
-                    time.sleep(0.5)
+                    # Show the loaded text in the editor and clear the file uploader
+                    editor_state["pending"] = file_content
+                    editor_state["upload_count"] += 1
                     st.rerun()
                     
-                except Exception as e:
+                except (UnicodeDecodeError, SessionManagerError) as e:
                     st.error(f"❌ Failed to load file: {str(e)}")
     
     st.markdown("---")
@@ -66,116 +160,74 @@ def render_requirements_editor(session: Session, session_manager: SessionManager
     # Text editor section
     st.markdown("### ✏️ Requirements Editor")
     
-    # Auto-save status indicator
-    col1, col2, col3 = st.columns([2, 1, 1])
+    # Status row, filled in once the form submission has been applied
+    status_col, chars_col, words_col = st.columns([2, 1, 1])
     
-    with col1:
-        st.markdown("*Auto-save is enabled - changes are saved automatically*")
+    with status_col:
+        st.markdown("*Changes are saved when you press Save*")
     
-    with col2:
-        # Character count
-        char_count = len(session.requirements_text)
-        st.metric("Characters", f"{char_count:,}")
+    text_key = f"requirements_text_{session.id}"
     
-    with col3:
-        # Word count (approximate)
-        word_count = len(session.requirements_text.split()) if session.requirements_text else 0
-        st.metric("Words", f"{word_count:,}")
-    
-    # Main text editor
-    requirements_key = f"requirements_editor_{session.id}"
-    
-    # Initialize session state for this editor if not exists
-    if requirements_key not in st.session_state:
-        st.session_state[requirements_key] = session.requirements_text
-    
-    # Text area with auto-save
-    new_requirements = st.text_area(
-        "Requirements Text",
-        value=st.session_state[requirements_key],
-        height=400,
-        placeholder="""Enter your requirements here. For example:
-
-As a user, I want to be able to authenticate with the system, so that I can access protected resources.
-
-Acceptance Criteria:
-- Users must be able to log in with email and password
-- Invalid credentials should show appropriate error messages
-- Successful login should redirect to the dashboard
-- Session should expire after 24 hours of inactivity
-
-Additional Requirements:
-- Support for password reset functionality
-- Two-factor authentication for enhanced security
-- Remember me option for convenience""",
-        help="Enter detailed requirements that will be used to generate Polar policies",
-        key=f"requirements_text_{session.id}"
-    )
+    # Load/reload/clear replace the editor text before the widget is created
+    if "pending" in editor_state:
+        st.session_state[text_key] = editor_state.pop("pending")
+    elif text_key not in st.session_state:
+        st.session_state[text_key] = session.requirements_text
     
-    # Auto-save logic
-    requirements_updated = False
-    if new_requirements != st.session_state[requirements_key]:
-        st.session_state[requirements_key] = new_requirements
+    # The form batches edits, so typing does not rerun the script until a button is pressed
+    with st.form(f"requirements_form_{session.id}", clear_on_submit=False, border=False):
+        new_requirements = st.text_area(
+            "Requirements Text",
+            height=400,
+            placeholder=_PLACEHOLDER,
+            help="Enter detailed requirements that will be used to generate Polar policies",
+            key=text_key
+        )
         
-        # Update session
-        session.requirements_text = new_requirements
-        session.update_timestamp()
+        col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
         
-        # Auto-save with debouncing
-        if f"last_save_{session.id}" not in st.session_state:
-            st.session_state[f"last_save_{session.id}"] = 0
+        with col1:
+            save_button = st.form_submit_button("💾 Save", type="primary", help="Save requirements")
         
-        current_time = time.time()
-        if current_time - st.session_state[f"last_save_{session.id}"] > 2:  # 2 second debounce
-            try:
-                session_manager.save_session(session)
-                st.session_state[f"last_save_{session.id}"] = current_time
-                requirements_updated = True
-                
-                # Show brief save confirmation
-                with st.empty():
-                    st.success("💾 Auto-saved")
-                    time.sleep(1)
-                    
-            except SessionManagerError as e:
-                st.error(f"❌ Auto-save failed: {str(e)}")
+        with col2:
+            reload_button = st.form_submit_button("🔄 Reload", help="Reload requirements from storage")
+        
+        with col3:
+            copy_button = st.form_submit_button("📋 Copy Text", help="Copy requirements to clipboard")
+        
+        with col4:
+            clear_button = st.form_submit_button("🗑️ Clear All", help="Clear all requirements text")
     
-    # Manual save and clear buttons
-    st.markdown("---")
+    requirements_updated = False
     
-    col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
+    if save_button and new_requirements == session.requirements_text:
+        st.info("ℹ️ No changes to save")
+    elif save_button:
+        try:
+            session.requirements_text = new_requirements
+            session.update_timestamp()
+            session_manager.save_session(session)
+            st.success("✅ Requirements saved successfully")
+            requirements_updated = True
+        except SessionManagerError as e:
+            st.error(f"❌ Save failed: {str(e)}")
     
-    with col1:
-        if st.button("💾 Save Now", help="Manually save requirements"):
-            try:
-                session.requirements_text = new_requirements
-                session.update_timestamp()
-                session_manager.save_session(session)
-                st.success("✅ Requirements saved successfully")
-                requirements_updated = True
-            except SessionManagerError as e:
-                st.error(f"❌ Save failed: {str(e)}")
+    if reload_button:
+        try:
+            # Reload session from storage
+            reloaded_session = session_manager.load_session(session.id)
+            editor_state["pending"] = reloaded_session.requirements_text
+            st.rerun()
+        except SessionManagerError as e:
+            st.error(f"❌ Reload failed: {str(e)}")
     
-    with col2:
-        if st.button("🔄 Reload", help="Reload requirements from storage"):
-            try:
-                # Reload session from storage
-                reloaded_session = session_manager.load_session(session.id)
-                st.session_state[requirements_key] = reloaded_session.requirements_text
-                st.success("✅ Requirements reloaded")
-                st.rerun()
-            except SessionManagerError as e:
-                st.error(f"❌ Reload failed: {str(e)}")
-    
-    with col3:
-        if st.button("📋 Copy Text", help="Copy requirements to clipboard"):
-            # Note: Streamlit doesn't have direct clipboard access
-            # This would need a JavaScript component for full functionality
-            st.info("💡 Use Ctrl+A, Ctrl+C to copy all text")
+    if copy_button:
+        # Note: Streamlit doesn't have direct clipboard access
+        # This would need a JavaScript component for full functionality
+        st.info("💡 Use Ctrl+A, Ctrl+C to copy all text")
     
-    with col4:
-        if st.button("🗑️ Clear All", help="Clear all requirements text", type="secondary"):
-            st.session_state.show_clear_dialog = True
+    if clear_button:
+        st.session_state.show_clear_dialog = True
     
     # Clear confirmation dialog
     if st.session_state.get("show_clear_dialog", False):
@@ -187,12 +239,11 @@ Additional Requirements:
             with col1:
                 if st.button("❌ Yes, Clear All", type="primary"):
                     session.requirements_text = ""
-                    st.session_state[requirements_key] = ""
                     session.update_timestamp()
                     
                     try:
                         session_manager.save_session(session)
-                        st.success("✅ Requirements cleared")
+                        editor_state["pending"] = ""
                         st.session_state.show_clear_dialog = False
                         requirements_updated = True
                         st.rerun()
@@ -204,74 +255,93 @@ Additional Requirements:
                     st.session_state.show_clear_dialog = False
                     st.rerun()
     
+    metrics = _analyze_requirements(session.requirements_text)
+    
+    with chars_col:
+        # Character count
+        st.metric("Characters", f"{metrics.char_count:,}")
+    
+    with words_col:
+        # Word count (approximate)
+        st.metric("Words", f"{metrics.word_count:,}")
+    
+    # Requirements preview and analysis sections
+    _render_analysis(session.requirements_text)
+    
+    return requirements_updated
+
+
+@st.fragment
+def _render_analysis(text: str) -> None:
+    """
+    Render the requirements preview and analysis panels.
+    
+    Runs as a fragment so widget interactions elsewhere on the page do not re-render it.
+    
+    Args:
+        text: Requirements text to preview and analyze
+    """
+    if not text:
+        return
+    
     # Requirements preview section
-    if session.requirements_text:
-        st.markdown("---")
-        st.markdown("### 👀 Requirements Preview")
-        
-        with st.expander("View formatted requirements", expanded=False):
-            # Display requirements with basic markdown formatting
-            st.markdown(session.requirements_text)
+    st.markdown("---")
+    st.markdown("### 👀 Requirements Preview")
+    
+    with st.expander("View formatted requirements", expanded=False):
+        # Display requirements with basic markdown formatting
+        st.markdown(text)
     
     # Requirements analysis section
-    if session.requirements_text:
-        st.markdown("---")
-        st.markdown("### 📊 Requirements Analysis")
-        
-        col1, col2, col3, col4 = st.columns(4)
+    metrics = _analyze_requirements(text)
+    
+    st.markdown("---")
+    st.markdown("### 📊 Requirements Analysis")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Lines", metrics.line_count)
+    
+    with col2:
+        st.metric("Paragraphs", metrics.paragraphs)
+    
+    with col3:
+        st.metric("Bullet Points", metrics.bullet_count)
+    
+    with col4:
+        st.metric("Read Time", f"{metrics.reading_time} min")
+    
+    # Content quality indicators
+    with st.expander("📋 Content Quality Indicators", expanded=False):
+        quality_checks = []
         
-        with col1:
-            # Line count
-            line_count = len(session.requirements_text.split('\n'))
-            st.metric("Lines", line_count)
+        # Check for user stories
+        if metrics.has_user_story:
+            quality_checks.append("✅ Contains user stories")
+        else:
+            quality_checks.append("⚠️ No user stories detected")
         
-        with col2:
-            # Paragraph count (empty lines as separators)
-            paragraphs = [p.strip() for p in session.requirements_text.split('\n\n') if p.strip()]
-            st.metric("Paragraphs", len(paragraphs))
+        # Check for acceptance criteria
+        if metrics.has_criteria:
+            quality_checks.append("✅ Contains acceptance criteria")
+        else:
+            quality_checks.append("⚠️ No acceptance criteria detected")
         
-        with col3:
-            # Bullet points count
-            bullet_count = session.requirements_text.count('- ') + session.requirements_text.count('* ')
-            st.metric("Bullet Points", bullet_count)
+        # Check for requirements structure
+        if metrics.has_structured:
+            quality_checks.append("✅ Contains structured requirements")
+        else:
+            quality_checks.append("⚠️ Consider adding structured requirements (WHEN/THEN format)")
         
-        with col4:
-            # Estimated reading time (average 200 words per minute)
-            reading_time = max(1, word_count // 200)
-            st.metric("Read Time", f"{reading_time} min")
+        # Check for length
+        if metrics.sufficient_detail:
+            quality_checks.append("✅ Sufficient detail provided")
+        else:
+            quality_checks.append("⚠️ Requirements might need more detail")
         
-        # Content quality indicators
-        with st.expander("📋 Content Quality Indicators", expanded=False):
-            quality_checks = []
-            
-            # Check for user stories
-            if "as a" in session.requirements_text.lower() or "as an" in session.requirements_text.lower():
-                quality_checks.append("✅ Contains user stories")
-            else:
-                quality_checks.append("⚠️ No user stories detected")
-            
-            # Check for acceptance criteria
-            if "acceptance criteria" in session.requirements_text.lower() or "criteria:" in session.requirements_text.lower():
-                quality_checks.append("✅ Contains acceptance criteria")
-            else:
-                quality_checks.append("⚠️ No acceptance criteria detected")
-            
-            # Check for requirements structure
-            if any(keyword in session.requirements_text.lower() for keyword in ["shall", "must", "should", "when", "then"]):
-                quality_checks.append("✅ Contains structured requirements")
-            else:
-                quality_checks.append("⚠️ Consider adding structured requirements (WHEN/THEN format)")
-            
-            # Check for length
-            if word_count > 50:
-                quality_checks.append("✅ Sufficient detail provided")
-            else:
-                quality_checks.append("⚠️ Requirements might need more detail")
-            
-            for check in quality_checks:
-                st.write(check)
-    
-    return requirements_updated
+        for check in quality_checks:
+            st.write(check)
 
 
 def render_requirements_templates() -> Optional[str]:
@@ -283,52 +353,11 @@ def render_requirements_templates() -> Optional[str]:
     """
     st.markdown("### 📋 Requirements Templates")
     
-    templates = {
-        "Authentication System": """As a user, I want to authenticate with the system, so that I can access protected resources.
-
-Acceptance Criteria:
-- WHEN a user provides valid credentials THEN the system SHALL authenticate the user
-- WHEN a user provides invalid credentials THEN the system SHALL display an error message
-- WHEN a user is authenticated THEN the system SHALL create a session
-- WHEN a session expires THEN the system SHALL require re-authentication
-
-Additional Requirements:
-- Support for password reset functionality
-- Two-factor authentication for enhanced security
-- Session timeout after 24 hours of inactivity""",
-        
-        "Document Management": """As a user, I want to manage documents in the system, so that I can organize and control access to my files.
-
-Acceptance Criteria:
-- WHEN a user uploads a document THEN the system SHALL store it securely
-- WHEN a user sets document permissions THEN the system SHALL enforce those permissions
-- WHEN a user shares a document THEN the system SHALL notify the recipient
-- WHEN a user deletes a document THEN the system SHALL remove it permanently
-
-Additional Requirements:
-- Version control for document updates
-- Audit trail for all document operations
-- Support for multiple file formats""",
-        
-        "API Access Control": """As a developer, I want to control API access, so that I can secure my application endpoints.
-
-Acceptance Criteria:
-- WHEN an API request is made THEN the system SHALL validate the API key
-- WHEN a user exceeds rate limits THEN the system SHALL return a 429 error
-- WHEN accessing protected endpoints THEN the system SHALL verify permissions
-- WHEN an unauthorized request is made THEN the system SHALL log the attempt
-
-Additional Requirements:
-- Role-based access control for different API endpoints
-- Request logging and monitoring
-- Support for OAuth 2.0 authentication""",
-        
-        "Custom Template": "Enter your own requirements here..."
-    }
+    templates = _load_templates()
     
     selected_template = st.selectbox(
         "Choose a template to get started:",
-        options=list(templates.keys()),
+        options=list(templates),
         help="Select a template to populate the requirements editor"
     )
     
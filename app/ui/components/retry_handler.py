@@ -1,17 +1,25 @@
 """Retry mechanisms and recovery utilities for Streamlit components."""
 
 import streamlit as st
+import math
 import time
-import asyncio
+import itertools
+from collections import OrderedDict
 from typing import Callable, Any, Optional, Dict, List
 from dataclasses import dataclass
 from enum import Enum
 import logging
 
-from .error_handler import StreamlitErrorHandler, ErrorContext, ErrorCategory, ErrorSeverity
+from .error_handler import StreamlitErrorHandler, ErrorContext, create_error_handler
 
 logger = logging.getLogger(__name__)
 
+# Seconds between countdown progress updates while waiting to retry
+_COUNTDOWN_TICK = 0.25
+
+# Most in-flight retry operations tracked per handler
+_MAX_ACTIVE_RETRIES = 64
+
 
 class RetryStrategy(Enum):
     """Different retry strategies."""
@@ -23,17 +31,21 @@ class RetryStrategy(Enum):
 
 @dataclass
 class RetryConfig:
-    """Configuration for retry operations."""
+    """Configuration for retry operations.
+    
+    allow_user_cancel is deprecated and ignored: attempts and backoff run in a
+    blocking loop, so a cancel click could never be seen before the loop ended.
+    """
     max_attempts: int = 3
     strategy: RetryStrategy = RetryStrategy.EXPONENTIAL_BACKOFF
     base_delay: float = 1.0
     max_delay: float = 30.0
     backoff_multiplier: float = 2.0
     show_progress: bool = True
-    allow_user_cancel: bool = True
+    allow_user_cancel: bool = True  # Deprecated, no effect
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RetryAttempt:
     """Information about a retry attempt."""
     attempt_number: int
@@ -48,7 +60,8 @@ class RetryHandler:
     
     def __init__(self, error_handler: StreamlitErrorHandler):
         self.error_handler = error_handler
-        self.active_retries: Dict[str, List[RetryAttempt]] = {}
+        self.active_retries: OrderedDict[int, List[RetryAttempt]] = OrderedDict()
+        self._retry_ids = itertools.count()
     
     def retry_with_ui(self, 
                      operation: Callable[[], Any],
@@ -76,13 +89,16 @@ class RetryHandler:
             context = ErrorContext()
         
         display_container = container or st
-        retry_id = f"{operation_name}_{time.time()}"
+        retry_id = next(self._retry_ids)
         self.active_retries[retry_id] = []
         
+        # Bound bookkeeping in case a retry is abandoned without reaching cleanup
+        while len(self.active_retries) > _MAX_ACTIVE_RETRIES:
+            self.active_retries.popitem(last=False)
+        
         # Create UI elements
         progress_placeholder = display_container.empty()
         status_placeholder = display_container.empty()
-        cancel_placeholder = display_container.empty() if config.allow_user_cancel else None
         
         try:
             for attempt in range(1, config.max_attempts + 1):
@@ -92,12 +108,6 @@ class RetryHandler:
                 if config.show_progress:
                     progress_placeholder.info(f"🔄 {operation_name} (Attempt {attempt}/{config.max_attempts})")
                 
-                # Show cancel button
-                if cancel_placeholder and attempt > 1:
-                    if cancel_placeholder.button(f"❌ Cancel {operation_name}", key=f"cancel_{retry_id}_{attempt}"):
-                        status_placeholder.warning(f"⚠️ {operation_name} cancelled by user")
-                        return False, None
-                
                 try:
                     # Execute the operation
                     result = operation()
@@ -113,14 +123,8 @@ class RetryHandler:
                     
                     # Clear UI elements
                     progress_placeholder.empty()
-                    if cancel_placeholder:
-                        cancel_placeholder.empty()
-                    
-                    status_placeholder.success(f"✅ {operation_name} completed successfully!")
-                    
-                    # Brief success display
-                    time.sleep(1)
                     status_placeholder.empty()
+                    st.toast(f"✅ {operation_name} completed successfully!")
                     
                     return True, result
                 
@@ -155,9 +159,6 @@ class RetryHandler:
                     else:
                         # Final failure
                         progress_placeholder.empty()
-                        if cancel_placeholder:
-                            cancel_placeholder.empty()
-                        
                         status_placeholder.error(f"❌ {operation_name} failed after {config.max_attempts} attempts")
                         
                         # Show retry summary
@@ -167,8 +168,7 @@ class RetryHandler:
         
         finally:
             # Cleanup
-            if retry_id in self.active_retries:
-                del self.active_retries[retry_id]
+            self.active_retries.pop(retry_id, None)
     
     def _calculate_delay(self, config: RetryConfig, attempt: int) -> float:
         """Calculate delay for next retry attempt."""
@@ -183,16 +183,27 @@ class RetryHandler:
             return config.base_delay
     
     def _show_countdown(self, delay: float, container) -> None:
-        """Show countdown timer for retry delay."""
+        """
+        Show a countdown progress bar until the retry delay has elapsed.
+        
+        The bar is redrawn every tick, which lets Streamlit stop the script
+        promptly if the user interacts with the page while waiting.
+        """
         countdown_placeholder = container.empty()
+        deadline = time.monotonic() + delay
+        remaining = delay
         
-        for remaining in range(int(delay), 0, -1):
-            countdown_placeholder.info(f"⏳ Retrying in {remaining} seconds...")
-            time.sleep(1)
+        while remaining > 0:
+            countdown_placeholder.progress(
+                1 - remaining / delay,
+                text=f"⏳ Retrying in {math.ceil(remaining)} seconds..."
+            )
+            time.sleep(min(_COUNTDOWN_TICK, remaining))
+            remaining = deadline - time.monotonic()
         
         countdown_placeholder.empty()
     
-    def _show_retry_summary(self, retry_id: str, container) -> None:
+    def _show_retry_summary(self, retry_id: int, container) -> None:
         """Show summary of retry attempts."""
         if retry_id not in self.active_retries:
             return
@@ -211,6 +222,11 @@ class RetryHandler:
                     st.code(str(attempt.error), language="text")
 
 
+def _retry_button_key(operation_name: str) -> str:
+    """Build the stable widget key for an operation's retry button."""
+    return f"retry_{operation_name.lower().replace(' ', '_')}"
+
+
 class OperationRetryUI:
     """UI components for retry operations."""
     
@@ -246,9 +262,7 @@ class OperationRetryUI:
         if config is None:
             config = RetryConfig()
         
-        button_key = f"retry_{operation_name.lower().replace(' ', '_')}_{time.time()}"
-        
-        if st.button(button_text, disabled=disabled, help=help_text, key=button_key):
+        if st.button(button_text, disabled=disabled, help=help_text, key=_retry_button_key(operation_name)):
             success, _ = self.retry_handler.retry_with_ui(
                 operation=operation,
                 operation_name=operation_name,
@@ -299,12 +313,11 @@ class OperationRetryUI:
 # Convenience functions for common retry scenarios
 def create_retry_handler() -> RetryHandler:
     """Create and cache a retry handler instance."""
-    if "retry_handler" not in st.session_state:
-        from .error_handler import create_error_handler
-        error_handler = create_error_handler()
-        st.session_state.retry_handler = RetryHandler(error_handler)
+    retry_handler = st.session_state.get("retry_handler")
+    if retry_handler is None:
+        retry_handler = st.session_state.retry_handler = RetryHandler(create_error_handler())
     
-    return st.session_state.retry_handler
+    return retry_handler
 
 
 def retry_policy_generation(generator_func: Callable[[], Any],
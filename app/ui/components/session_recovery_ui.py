@@ -2,7 +2,10 @@
 
 import streamlit as st
 import time
-from typing import Dict, List, Optional, Any
+from collections import deque
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from ...services.session_recovery import (
@@ -15,8 +18,28 @@ from ...storage.base import StorageBackend
 from .error_handler import create_error_handler, error_boundary, ErrorContext
 
 
-def create_recovery_service() -> SessionRecoveryService:
-    """Create and cache session recovery service."""
+@dataclass
+class RecoveryResultSummary:
+    """Display-only record of a recovery result kept in the recovery history."""
+    session_id: str
+    short_id: str
+    status: RecoveryStatus
+    timestamp: str
+    display_time: str
+    issues_found: List[str]
+    issues_fixed: List[str]
+    backup_created: bool = False
+    recovery_time: float = 0.0
+    error_message: Optional[str] = None
+
+
+def create_recovery_service(show_error: bool = True) -> SessionRecoveryService:
+    """Create and cache session recovery service.
+    
+    Args:
+        show_error: Whether to show an error banner when the required
+            services are not initialized
+    """
     if "recovery_service" not in st.session_state:
         # Get required services from session state
         session_manager = st.session_state.get("session_manager")
@@ -24,7 +47,8 @@ def create_recovery_service() -> SessionRecoveryService:
         storage_backend = st.session_state.get("storage_backend")
         
         if not all([session_manager, event_logger, storage_backend]):
-            st.error("❌ Required services not initialized for session recovery")
+            if show_error:
+                st.error("❌ Required services not initialized for session recovery")
             return None
         
         st.session_state.recovery_service = SessionRecoveryService(
@@ -36,6 +60,86 @@ def create_recovery_service() -> SessionRecoveryService:
     return st.session_state.recovery_service
 
 
+# Most sessions offered in a selector at once; the filter narrows the rest
+_MAX_SESSION_OPTIONS = 200
+
+# Backups rendered per page in the backup list
+_BACKUP_PAGE_SIZE = 20
+
+# Recovery results kept in the session history; older entries are dropped
+_MAX_RECOVERY_HISTORY = 100
+
+_DASHBOARD_TABS = (
+    "🔍 Integrity Scan",
+    "🔧 Manual Recovery",
+    "💾 Backup Management",
+    "📊 Recovery History"
+)
+
+_SEVERITY_ICONS = {
+    CorruptionType.MISSING_SESSION_FILE: "🚨",
+    CorruptionType.INVALID_JSON: "🚨",
+    CorruptionType.MISSING_EVENTS: "⚠️",
+    CorruptionType.INCONSISTENT_TIMESTAMPS: "⚠️",
+    CorruptionType.ORPHANED_FILES: "ℹ️",
+    CorruptionType.INVALID_POLICY_CONTENT: "⚠️",
+    CorruptionType.MISSING_VALIDATION_RESULTS: "ℹ️"
+}
+
+_SEVERITY_COLORS = {
+    "low": "blue",
+    "medium": "orange",
+    "high": "red",
+    "critical": "red"
+}
+
+_STATUS_ICONS = {
+    RecoveryStatus.SUCCESS: "✅",
+    RecoveryStatus.PARTIAL: "⚠️",
+    RecoveryStatus.FAILED: "❌",
+    RecoveryStatus.SKIPPED: "⏭️"
+}
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _get_dashboard_snapshot(_recovery_service: SessionRecoveryService, storage_id: int) -> Dict[str, Any]:
+    """Get session selector options and backup counts, cached briefly per storage backend."""
+    snapshot = _recovery_service.get_dashboard_snapshot()
+    return {
+        "session_options": [(f"{name} ({session_id[:8]})", session_id)
+                            for session_id, name in snapshot["sessions"]],
+        "backup_counts": snapshot["backup_counts"]
+    }
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _analyze_session_cached(_recovery_service: SessionRecoveryService, storage_id: int,
+                            session_id: str, fingerprint: Tuple[Tuple[str, str], ...]) -> List[CorruptionIssue]:
+    """Analyze a session, cached until its stored files change."""
+    return _recovery_service._analyze_session_integrity(session_id)
+
+
+def _render_session_selector(session_options: List[Tuple[str, str]], label: str, key: str,
+                             help: Optional[str] = None) -> Optional[str]:
+    """Render a filterable, size-capped session selector and return the selected session ID."""
+    query = st.text_input("Filter sessions", key=f"{key}_filter", placeholder="Filter by name or ID")
+    
+    if query.strip():
+        query_lower = query.strip().lower()
+        session_options = [option for option in session_options if query_lower in option[0].lower()]
+    
+    if not session_options:
+        st.info("📝 No sessions match the filter")
+        return None
+    
+    if len(session_options) > _MAX_SESSION_OPTIONS:
+        st.caption(f"Showing the {_MAX_SESSION_OPTIONS} most recent of {len(session_options)} sessions")
+    
+    options = dict(session_options[:_MAX_SESSION_OPTIONS])
+    selected_label = st.selectbox(label, options=list(options), help=help, key=key)
+    return options[selected_label]
+
+
 def render_session_recovery_dashboard():
     """Render the main session recovery dashboard."""
     st.subheader("🔧 Session Recovery & Data Integrity")
@@ -44,24 +148,23 @@ def render_session_recovery_dashboard():
     if not recovery_service:
         return
     
-    # Create tabs for different recovery functions
-    tab1, tab2, tab3, tab4 = st.tabs([
-        "🔍 Integrity Scan", 
-        "🔧 Manual Recovery", 
-        "💾 Backup Management", 
-        "📊 Recovery History"
-    ])
-    
-    with tab1:
+    # Only the selected section runs; st.tabs would execute every tab body,
+    # including the session and backup listings, on each rerun
+    active_tab = st.radio(
+        "Recovery section",
+        options=list(_DASHBOARD_TABS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="recovery_active_tab"
+    )
+    
+    if active_tab == "🔍 Integrity Scan":
         render_integrity_scan_tab(recovery_service)
-    
-    with tab2:
+    elif active_tab == "🔧 Manual Recovery":
         render_manual_recovery_tab(recovery_service)
-    
-    with tab3:
+    elif active_tab == "💾 Backup Management":
         render_backup_management_tab(recovery_service)
-    
-    with tab4:
+    else:
         render_recovery_history_tab()
 
 
@@ -92,41 +195,39 @@ def render_manual_recovery_tab(recovery_service: SessionRecoveryService):
     
     # Session selector
     try:
-        session_manager = st.session_state.get("session_manager")
-        if session_manager:
-            sessions = session_manager.list_sessions()
-            
-            if not sessions:
-                st.info("📝 No sessions found")
-                return
-            
-            session_options = [(f"{s.name} ({s.id[:8]})", s.id) for s in sessions]
-            
-            selected_label = st.selectbox(
-                "Select Session to Recover",
-                options=[label for label, _ in session_options],
-                help="Choose a session to analyze and potentially recover"
-            )
-            
-            selected_session_id = next(sid for label, sid in session_options if label == selected_label)
-            
-            # Recovery options
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                create_backup = st.checkbox("Create Backup Before Recovery", value=True)
-                force_event_replay = st.checkbox("Force Event Replay Recovery", value=False)
-            
-            with col2:
-                if st.button("🔧 Analyze Session", key="analyze_session"):
-                    analyze_session(recovery_service, selected_session_id)
-                
-                if st.button("🚀 Recover Session", type="primary", key="recover_session"):
-                    recover_session(recovery_service, selected_session_id, create_backup, force_event_replay)
+        snapshot = _get_dashboard_snapshot(recovery_service, id(recovery_service.storage))
+        session_options = snapshot["session_options"]
+        
+        if not session_options:
+            st.info("📝 No sessions found")
+            return
+        
+        selected_session_id = _render_session_selector(
+            session_options,
+            "Select Session to Recover",
+            key="recovery_session_selector",
+            help="Choose a session to analyze and potentially recover"
+        )
+        if not selected_session_id:
+            return
+        
+        # Recovery options
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            create_backup = st.checkbox("Create Backup Before Recovery", value=True)
+            force_event_replay = st.checkbox("Force Event Replay Recovery", value=False)
+        
+        with col2:
+            if st.button("🔧 Analyze Session", key="analyze_session"):
+                analyze_session(recovery_service, selected_session_id)
             
-            # Display analysis results
-            if f"analysis_{selected_session_id}" in st.session_state:
-                display_session_analysis(st.session_state[f"analysis_{selected_session_id}"])
+            if st.button("🚀 Recover Session", type="primary", key="recover_session"):
+                recover_session(recovery_service, selected_session_id, create_backup, force_event_replay)
+        
+        # Display analysis results
+        if f"analysis_{selected_session_id}" in st.session_state:
+            display_session_analysis(st.session_state[f"analysis_{selected_session_id}"])
     
     except Exception as e:
         st.error(f"❌ Error loading sessions: {str(e)}")
@@ -139,35 +240,35 @@ def render_backup_management_tab(recovery_service: SessionRecoveryService):
     
     # Session selector for backup
     try:
-        session_manager = st.session_state.get("session_manager")
-        if session_manager:
-            sessions = session_manager.list_sessions()
+        snapshot = _get_dashboard_snapshot(recovery_service, id(recovery_service.storage))
+        session_options = snapshot["session_options"]
+        
+        if session_options:
+            selected_session_id = _render_session_selector(
+                session_options,
+                "Select Session for Backup Operations",
+                key="backup_session_selector"
+            )
+            if not selected_session_id:
+                return
+            
+            backup_count = snapshot["backup_counts"].get(selected_session_id, 0)
+            st.caption(f"💾 {backup_count} backup(s) stored for this session")
             
-            if sessions:
-                session_options = [(f"{s.name} ({s.id[:8]})", s.id) for s in sessions]
-                
-                selected_label = st.selectbox(
-                    "Select Session for Backup Operations",
-                    options=[label for label, _ in session_options],
-                    key="backup_session_selector"
-                )
-                
-                selected_session_id = next(sid for label, sid in session_options if label == selected_label)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    if st.button("💾 Create Backup", key="create_backup"):
-                        create_session_backup(recovery_service, selected_session_id)
-                
-                with col2:
-                    if st.button("📋 List Backups", key="list_backups"):
-                        list_session_backups(recovery_service, selected_session_id)
-                
-                # Display backup list if available
-                if f"backups_{selected_session_id}" in st.session_state:
-                    display_backup_list(recovery_service, selected_session_id, 
-                                      st.session_state[f"backups_{selected_session_id}"])
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.button("💾 Create Backup", key="create_backup"):
+                    create_session_backup(recovery_service, selected_session_id)
+            
+            with col2:
+                if st.button("📋 List Backups", key="list_backups"):
+                    list_session_backups(recovery_service, selected_session_id)
+            
+            # Display backup list if available
+            if f"backups_{selected_session_id}" in st.session_state:
+                display_backup_list(recovery_service, selected_session_id, 
+                                  st.session_state[f"backups_{selected_session_id}"])
     
     except Exception as e:
         st.error(f"❌ Error in backup management: {str(e)}")
@@ -178,23 +279,68 @@ def render_recovery_history_tab():
     st.markdown("### 📊 Recovery History")
     st.markdown("View history of recovery operations.")
     
-    if "recovery_history" not in st.session_state:
-        st.session_state.recovery_history = []
-    
-    history = st.session_state.recovery_history
+    history = _get_recovery_history()
     
     if not history:
         st.info("📝 No recovery operations performed yet")
         return
     
-    # Display recovery history
-    for i, result in enumerate(reversed(history[-10:])):  # Show last 10
-        with st.expander(
-            f"🔧 {result.session_id[:8]} - {result.status.value.title()} "
-            f"({datetime.fromisoformat(result.timestamp) if hasattr(result, 'timestamp') else 'Unknown time'})",
-            expanded=False
-        ):
-            display_recovery_result(result)
+    # Display recovery history as one table; details only for the selected row
+    recent = list(islice(reversed(history), 10))  # Show last 10
+    event = st.dataframe(
+        [
+            {
+                "Session": summary.short_id,
+                "Status": summary.status.value.title(),
+                "Time": summary.display_time,
+                "Issues Found": len(summary.issues_found),
+                "Issues Fixed": len(summary.issues_fixed)
+            }
+            for summary in recent
+        ],
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="recovery_history_table"
+    )
+    
+    if event.selection.rows:
+        summary = recent[event.selection.rows[0]]
+        st.markdown(f"#### 🔧 {summary.short_id} - {summary.status.value.title()} ({summary.display_time})")
+        display_recovery_result(summary)
+    else:
+        st.caption("Select a row to see recovery details")
+
+
+def _record_recoveries(results: List[RecoveryResult]):
+    """Add summaries of recovery results to the history."""
+    now = datetime.now()
+    timestamp = now.isoformat()
+    display_time = now.strftime('%Y-%m-%d %H:%M:%S')
+    
+    _get_recovery_history().extend(
+        RecoveryResultSummary(
+            session_id=result.session_id,
+            short_id=result.session_id[:8],
+            status=result.status,
+            timestamp=timestamp,
+            display_time=display_time,
+            issues_found=[issue.description for issue in result.issues_found],
+            issues_fixed=[issue.description for issue in result.issues_fixed],
+            backup_created=result.backup_created,
+            recovery_time=result.recovery_time,
+            error_message=result.error_message
+        )
+        for result in results
+    )
+
+
+def _get_recovery_history() -> deque:
+    """Get the bounded recovery history for this session."""
+    if "recovery_history" not in st.session_state:
+        st.session_state.recovery_history = deque(maxlen=_MAX_RECOVERY_HISTORY)
+    return st.session_state.recovery_history
 
 
 def run_integrity_scan(recovery_service: SessionRecoveryService):
@@ -203,10 +349,14 @@ def run_integrity_scan(recovery_service: SessionRecoveryService):
     
     with error_boundary(error_handler, ErrorContext(component="IntegrityScan")):
         progress_placeholder = st.empty()
-        progress_placeholder.info("🔍 Scanning sessions for integrity issues...")
+        progress_bar = progress_placeholder.progress(0.0, text="🔍 Scanning sessions for integrity issues...")
+        
+        def update_progress(completed: int, total: int):
+            progress_bar.progress(completed / total,
+                                  text=f"🔍 Scanned {completed} of {total} sessions...")
         
         start_time = time.time()
-        report = recovery_service.scan_all_sessions()
+        report = recovery_service.scan_all_sessions(progress_callback=update_progress)
         scan_time = time.time() - start_time
         
         progress_placeholder.empty()
@@ -240,12 +390,7 @@ def run_auto_recovery(recovery_service: SessionRecoveryService):
             return
         
         # Store results in history
-        if "recovery_history" not in st.session_state:
-            st.session_state.recovery_history = []
-        
-        for result in results:
-            result.timestamp = datetime.now().isoformat()
-            st.session_state.recovery_history.append(result)
+        _record_recoveries(results)
         
         # Display summary
         successful = len([r for r in results if r.status == RecoveryStatus.SUCCESS])
@@ -270,7 +415,8 @@ def analyze_session(recovery_service: SessionRecoveryService, session_id: str):
         
         # This is a simplified analysis - in a real implementation,
         # we'd call a method on recovery_service to analyze without recovering
-        issues = recovery_service._analyze_session_integrity(session_id)
+        issues = _analyze_session_cached(recovery_service, id(recovery_service.storage), session_id,
+                                         recovery_service.get_session_fingerprint(session_id))
         
         progress_placeholder.empty()
         
@@ -303,13 +449,10 @@ def recover_session(recovery_service: SessionRecoveryService, session_id: str,
         )
         
         progress_placeholder.empty()
+        _get_dashboard_snapshot.clear()
         
         # Store result in history
-        if "recovery_history" not in st.session_state:
-            st.session_state.recovery_history = []
-        
-        result.timestamp = datetime.now().isoformat()
-        st.session_state.recovery_history.append(result)
+        _record_recoveries([result])
         
         # Display result
         if result.status == RecoveryStatus.SUCCESS:
@@ -333,8 +476,8 @@ def create_session_backup(recovery_service: SessionRecoveryService, session_id:
         success = recovery_service.create_session_backup(session_id)
         
         progress_placeholder.empty()
-        
         if success:
+            _get_dashboard_snapshot.clear()
             st.success(f"✅ Backup created for session {session_id[:8]}")
         else:
             st.error(f"❌ Failed to create backup for session {session_id[:8]}")
@@ -381,15 +524,7 @@ def display_integrity_report(report: IntegrityReport):
         st.markdown("#### 🔍 Issues by Type")
         
         for issue_type, count in report.issues_by_type.items():
-            severity_icon = {
-                CorruptionType.MISSING_SESSION_FILE: "🚨",
-                CorruptionType.INVALID_JSON: "🚨",
-                CorruptionType.MISSING_EVENTS: "⚠️",
-                CorruptionType.INCONSISTENT_TIMESTAMPS: "⚠️",
-                CorruptionType.ORPHANED_FILES: "ℹ️",
-                CorruptionType.INVALID_POLICY_CONTENT: "⚠️",
-                CorruptionType.MISSING_VALIDATION_RESULTS: "ℹ️"
-            }.get(issue_type, "❓")
+            severity_icon = _SEVERITY_ICONS.get(issue_type, "❓")
             
             st.write(f"{severity_icon} **{issue_type.value.replace('_', ' ').title()}**: {count} sessions")
     
@@ -416,12 +551,7 @@ def display_session_analysis(analysis: Dict[str, Any]):
     st.warning(f"⚠️ Found {len(issues)} issues:")
     
     for i, issue in enumerate(issues, 1):
-        severity_color = {
-            "low": "blue",
-            "medium": "orange", 
-            "high": "red",
-            "critical": "red"
-        }.get(issue.severity, "gray")
+        severity_color = _SEVERITY_COLORS.get(issue.severity, "gray")
         
         with st.expander(f"Issue {i}: {issue.description}", expanded=False):
             st.write(f"**Type:** {issue.type.value.replace('_', ' ').title()}")
@@ -440,24 +570,40 @@ def display_backup_list(recovery_service: SessionRecoveryService, session_id: st
         st.info("📝 No backups found")
         return
     
-    for backup in backups:
-        with st.expander(
-            f"Backup {backup['timestamp']} ({backup['size']} bytes)",
-            expanded=False
-        ):
-            st.write(f"**Created:** {backup['created']}")
-            st.write(f"**Size:** {backup['size']:,} bytes")
-            st.write(f"**Key:** {backup['key']}")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                if st.button(f"🔄 Restore", key=f"restore_{backup['timestamp']}"):
-                    restore_from_backup(recovery_service, session_id, backup['timestamp'])
-            
-            with col2:
-                if st.button(f"🗑️ Delete", key=f"delete_{backup['timestamp']}"):
-                    st.warning("⚠️ Backup deletion not implemented yet")
+    limit_key = f"backups_limit_{session_id}"
+    limit = st.session_state.get(limit_key, _BACKUP_PAGE_SIZE)
+    
+    visible = {backup['timestamp']: backup for backup in backups[:limit]}
+    selected_timestamp = st.radio(
+        "Select backup",
+        options=list(visible),
+        format_func=lambda timestamp: f"Backup {timestamp} ({visible[timestamp]['size']:,} bytes)",
+        key=f"backup_select_{session_id}"
+    )
+    
+    backup = visible[selected_timestamp]
+    st.write(f"**Created:** {backup['created']}")
+    st.write(f"**Key:** {backup['key']}")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        if st.button("🔄 Restore", key=f"restore_{session_id}"):
+            restore_from_backup(recovery_service, session_id, selected_timestamp)
+    
+    with col2:
+        if st.button("🗑️ Delete", key=f"delete_{session_id}"):
+            st.warning("⚠️ Backup deletion not implemented yet")
+    
+    remaining = len(backups) - limit
+    if remaining > 0:
+        st.button(f"Show older ({remaining} more)", key=f"backups_more_{session_id}",
+                  on_click=_show_more_backups, args=(limit_key, limit + _BACKUP_PAGE_SIZE))
+
+
+def _show_more_backups(limit_key: str, limit: int):
+    """Raise the number of backups shown in the backup list."""
+    st.session_state[limit_key] = limit
 
 
 def restore_from_backup(recovery_service: SessionRecoveryService, session_id: str, timestamp: str):
@@ -471,37 +617,30 @@ def restore_from_backup(recovery_service: SessionRecoveryService, session_id: st
         success = recovery_service.restore_session_from_backup(session_id, timestamp)
         
         progress_placeholder.empty()
-        
         if success:
+            _get_dashboard_snapshot.clear()
             st.success(f"✅ Successfully restored session {session_id[:8]} from backup")
             st.info("💡 Please refresh the page to see the restored session")
         else:
             st.error(f"❌ Failed to restore session {session_id[:8]} from backup")
 
 
-def display_recovery_result(result: RecoveryResult):
+def display_recovery_result(result: RecoveryResultSummary):
     """Display recovery operation result."""
-    status_icons = {
-        RecoveryStatus.SUCCESS: "✅",
-        RecoveryStatus.PARTIAL: "⚠️",
-        RecoveryStatus.FAILED: "❌",
-        RecoveryStatus.SKIPPED: "⏭️"
-    }
-    
-    icon = status_icons.get(result.status, "❓")
+    icon = _STATUS_ICONS.get(result.status, "❓")
     st.write(f"**Status:** {icon} {result.status.value.title()}")
     st.write(f"**Recovery Time:** {result.recovery_time:.2f} seconds")
     st.write(f"**Backup Created:** {'✅ Yes' if result.backup_created else '❌ No'}")
     
     if result.issues_found:
         st.write(f"**Issues Found:** {len(result.issues_found)}")
-        for issue in result.issues_found:
-            st.write(f"  • {issue.description}")
+        for description in result.issues_found:
+            st.write(f"  • {description}")
     
     if result.issues_fixed:
         st.write(f"**Issues Fixed:** {len(result.issues_fixed)}")
-        for issue in result.issues_fixed:
-            st.write(f"  • {issue.description}")
+        for description in result.issues_fixed:
+            st.write(f"  • {description}")
     
     if result.error_message:
         st.write(f"**Error:** {result.error_message}")
@@ -509,7 +648,9 @@ def display_recovery_result(result: RecoveryResult):
 
 def render_session_recovery_widget(session_id: str):
     """Render a compact session recovery widget for individual sessions."""
-    recovery_service = create_recovery_service()
+    # Rendered once per session row, so stay silent rather than repeating
+    # the missing-services banner for every row
+    recovery_service = create_recovery_service(show_error=False)
     if not recovery_service:
         return
     
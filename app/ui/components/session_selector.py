@@ -1,11 +1,50 @@
 """Session selection and creation UI components."""
 
 import streamlit as st
-from typing import Optional, List
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 
 from ...models import Session, SessionMetadata
 from ...services.session_manager import SessionManager, SessionManagerError
+from ...storage import StorageBackend, LocalStorageBackend, S3StorageBackend
+
+
+def _storage_identity(storage: StorageBackend) -> str:
+    """Stable name for the location a storage backend reads and writes."""
+    if isinstance(storage, S3StorageBackend):
+        return f"s3://{storage.bucket_name}/{storage.prefix}"
+    if isinstance(storage, LocalStorageBackend):
+        return f"file://{storage.base_path.resolve()}"
+    return f"{type(storage).__name__}:{id(storage)}"
+
+
+def _manager_key(session_manager: SessionManager) -> Tuple[str, int]:
+    """Cache key that changes whenever the manager creates, saves or deletes a session.
+    
+    Keyed on the storage location rather than the manager object, so a new manager
+    never picks up another storage's pages. The version only counts this manager's
+    writes: sessions changed through other browser sessions on the same storage can
+    stay hidden until the 30s cache TTL expires.
+    """
+    return (_storage_identity(session_manager.storage), session_manager.version)
+
+
+# Sessions shown per page in the session list
+_PAGE_SIZE = 10
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_list_sessions(_session_manager: SessionManager, manager_key: Tuple[str, int],
+                          search_term: str, offset: int, limit: int) -> List[SessionMetadata]:
+    """List one page of session metadata, cached until the session manager changes."""
+    return _session_manager.list_sessions(limit=limit, search_term=search_term, offset=offset)
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_session_statistics(_session_manager: SessionManager,
+                               manager_key: Tuple[str, int]) -> Dict[str, Any]:
+    """Get session statistics, cached until the session manager changes."""
+    return _session_manager.get_session_statistics()
 
 
 def render_session_selector(session_manager: SessionManager) -> Optional[str]:
@@ -58,7 +97,7 @@ def render_session_selector(session_manager: SessionManager) -> Optional[str]:
     with col2:
         # Session statistics
         try:
-            stats = session_manager.get_session_statistics()
+            stats = _cached_session_statistics(session_manager, _manager_key(session_manager))
             st.metric("Total Sessions", stats["total_sessions"])
             st.metric("With Policies", stats["sessions_with_policies"])
         except SessionManagerError:
@@ -68,78 +107,101 @@ def render_session_selector(session_manager: SessionManager) -> Optional[str]:
     st.markdown("### 📋 Existing Sessions")
     
     try:
-        sessions = session_manager.list_sessions(limit=50)
-        
-        if not sessions:
-            st.info("No sessions found. Create your first session above!")
-            return None
-        
         # Search functionality
         search_term = st.text_input(
             "🔍 Search Sessions",
             placeholder="Search by session name...",
-            key="session_search"
+            key="session_search",
+            on_change=_set_session_page,
+            args=(0,)
         )
         
-        # Filter sessions based on search
-        if search_term:
-            filtered_sessions = [
-                s for s in sessions 
-                if search_term.lower() in s.name.lower()
-            ]
-        else:
-            filtered_sessions = sessions
+        # Fetch one extra session to know whether a next page exists
+        page = st.session_state.get("session_page", 0)
+        page_sessions = _cached_list_sessions(
+            session_manager, _manager_key(session_manager),
+            search_term.strip(), page * _PAGE_SIZE, _PAGE_SIZE + 1
+        )
+        has_next = len(page_sessions) > _PAGE_SIZE
+        page_sessions = page_sessions[:_PAGE_SIZE]
+        
+        if not page_sessions and page > 0:
+            # The current page emptied (e.g. after a deletion); go back to the start
+            st.session_state.session_page = 0
+            st.rerun()
         
-        if not filtered_sessions:
-            st.warning("No sessions match your search criteria.")
+        if not page_sessions:
+            if search_term.strip():
+                st.warning("No sessions match your search criteria.")
+            else:
+                st.info("No sessions found. Create your first session above!")
             return None
         
         # Display sessions in a more compact format
-        selected_session_id = None
+        selected_id = st.session_state.get("selected_session_id")
+        for session in page_sessions:
+            # One markdown line and one button per row keeps the element count low
+            req_badge = "📝 Req" if session.has_requirements else "📝 No Req"
+            col1, col2 = st.columns([5, 1])
+            
+            with col1:
+                st.markdown(
+                    f"**{session.name}** · _Created: {session.created_at.strftime('%Y-%m-%d %H:%M')}_"
+                    f" · {req_badge} · 🔧 {session.policy_count}"
+                )
+            
+            with col2:
+                # Select button; the callback stores the selection before the
+                # click's own rerun, so no extra rerun is needed
+                st.button(
+                    "Select", 
+                    key=f"select_{session.id}",
+                    type="primary" if selected_id == session.id else "secondary",
+                    on_click=_select_session,
+                    args=(session.id,)
+                )
         
-        for session in filtered_sessions[:20]:  # Limit to 20 for performance
-            with st.container():
-                col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
-                
-                with col1:
-                    # Session name and metadata
-                    st.markdown(f"**{session.name}**")
-                    st.caption(f"Created: {session.created_at.strftime('%Y-%m-%d %H:%M')}")
-                
-                with col2:
-                    # Status indicators
-                    if session.has_requirements:
-                        st.success("📝 Req")
-                    else:
-                        st.warning("📝 No Req")
-                
-                with col3:
-                    # Policy count
-                    if session.has_policies:
-                        st.info(f"🔧 {session.policy_count}")
-                    else:
-                        st.warning("🔧 0")
-                
-                with col4:
-                    # Select button
-                    if st.button(
-                        "Select", 
-                        key=f"select_{session.id}",
-                        type="primary" if st.session_state.get("selected_session_id") == session.id else "secondary"
-                    ):
-                        selected_session_id = session.id
-                        st.session_state.selected_session_id = session.id
-                        st.rerun()
-                
-                st.divider()
+        # Pagination controls
+        if page > 0 or has_next:
+            prev_col, page_col, next_col = st.columns([1, 2, 1])
+            with prev_col:
+                st.button("⬅️ Prev", key="session_page_prev", disabled=page == 0,
+                          on_click=_set_session_page, args=(page - 1,))
+            with page_col:
+                st.caption(f"Page {page + 1}")
+            with next_col:
+                st.button("Next ➡️", key="session_page_next", disabled=not has_next,
+                          on_click=_set_session_page, args=(page + 1,))
         
-        return selected_session_id or st.session_state.get("selected_session_id")
+        return st.session_state.get("selected_session_id")
         
     except SessionManagerError as e:
         st.error(f"❌ Failed to load sessions: {str(e)}")
         return None
 
 
+def _set_session_page(page: int) -> None:
+    """Move the session list to the given page."""
+    st.session_state.session_page = page
+
+
+def _select_session(session_id: str) -> None:
+    """Mark a session from the list as selected."""
+    st.session_state.selected_session_id = session_id
+
+
+def _format_time_ago(elapsed_seconds: int) -> str:
+    """Format an elapsed number of seconds as a short relative time."""
+    days, remainder = divmod(elapsed_seconds, 86400)
+    if days > 0:
+        return f"{days} days ago"
+    if remainder > 3600:
+        return f"{remainder // 3600} hours ago"
+    if remainder > 60:
+        return f"{remainder // 60} minutes ago"
+    return "Just now"
+
+
 def render_session_header(session: Session) -> None:
     """
     Render the header for the selected session.
@@ -165,17 +227,8 @@ def render_session_header(session: Session) -> None:
     
     with col3:
         # Last updated
-        time_diff = datetime.utcnow() - session.updated_at
-        if time_diff.days > 0:
-            updated_str = f"{time_diff.days} days ago"
-        elif time_diff.seconds > 3600:
-            updated_str = f"{time_diff.seconds // 3600} hours ago"
-        elif time_diff.seconds > 60:
-            updated_str = f"{time_diff.seconds // 60} minutes ago"
-        else:
-            updated_str = "Just now"
-        
-        st.metric("Last Updated", updated_str)
+        elapsed = (datetime.utcnow() - session.updated_at).total_seconds()
+        st.metric("Last Updated", _format_time_ago(max(0, int(elapsed))))
     
     # Session actions
     col1, col2, col3, col4 = st.columns([1, 1, 1, 1])
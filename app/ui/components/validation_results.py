@@ -5,6 +5,8 @@ from typing import Optional, List, Dict, Any
 from datetime import datetime, timedelta
 import asyncio
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 from app.models.session import Session, ValidationResult
 from app.models.policy import PolicyValidationResult, PolicyValidationRequest
@@ -13,6 +15,18 @@ from app.services.async_validator import AsyncPolarValidator
 from app.services.validation_retry_service import ValidationRetryService
 
 
+# (keyword, category) pairs for the error analysis, checked in order so
+# earlier categories take precedence
+_ERROR_CATEGORY_KEYWORDS = (
+    ("syntax", "Syntax Errors"),
+    ("undefined", "Undefined References"),
+    ("not found", "Undefined References"),
+    ("type", "Type Errors"),
+    ("permission", "Permission Logic"),
+    ("allow", "Permission Logic"),
+)
+
+
 def render_validation_results_interface(session: Session, session_manager: SessionManager) -> None:
     """
     Render the complete validation results interface.
@@ -45,14 +59,18 @@ def render_validation_results_interface(session: Session, session_manager: Sessi
     
     st.markdown("---")
     
+    # Select the recent results once, after any validation triggered above,
+    # and share them between the history and metrics panels
+    recent_results = session.get_recent_validations(10)
+    
     # Validation history and metrics
     col1, col2 = st.columns(2)
     
     with col1:
-        render_validation_history(session)
+        render_validation_history(session, recent_results)
     
     with col2:
-        render_validation_metrics(session)
+        render_validation_metrics(session, recent_results)
 
 
 def render_validation_status_display(session: Session, current_policy) -> None:
@@ -111,8 +129,7 @@ def render_validation_actions(session: Session, session_manager: SessionManager,
     if st.button("🔍 Validate Policy", type="primary", use_container_width=True):
         with st.spinner("Validating policy..."):
             try:
-                # Initialize async validator
-                validator = AsyncPolarValidator()
+                validator = _get_validator()
                 
                 # Create validation request
                 validation_request = PolicyValidationRequest(
@@ -142,9 +159,6 @@ def render_validation_actions(session: Session, session_manager: SessionManager,
                 else:
                     st.error("❌ Policy validation failed")
                 
-                # Clean up
-                asyncio.run(validator.close())
-                
                 # Refresh the page to show new results
                 st.rerun()
                 
@@ -172,8 +186,7 @@ def render_validation_actions(session: Session, session_manager: SessionManager,
         if st.button("🗑️ Clear Validation History", type="secondary", use_container_width=True):
             if st.session_state.get("confirm_clear_validation", False):
                 # Clear validation results
-                session.validation_results = []
-                session.update_timestamp()
+                session.clear_validation_results()
                 session_manager.save_session(session)
                 
                 # Reset confirmation state
@@ -185,12 +198,14 @@ def render_validation_actions(session: Session, session_manager: SessionManager,
                 st.warning("⚠️ Click again to confirm clearing all validation history.")
 
 
-def render_validation_history(session: Session) -> None:
+def render_validation_history(session: Session,
+                              recent_results: Optional[List[ValidationResult]] = None) -> None:
     """
     Render validation history display.
     
     Args:
         session: Current session
+        recent_results: Validation results sorted newest first, if already computed
     """
     st.subheader("📚 Validation History")
     
@@ -198,19 +213,15 @@ def render_validation_history(session: Session) -> None:
         st.info("📝 No validation history available.")
         return
     
-    # Sort validation results by timestamp (most recent first)
-    sorted_results = sorted(session.validation_results, key=lambda r: r.validated_at, reverse=True)
+    # Results are kept in chronological order, so the most recent are a slice
+    if recent_results is None:
+        recent_results = session.get_recent_validations(10)
+    recent_results = recent_results[:10]
+    policy_ids = {p.id for p in session.generated_policies}
     
     # Show recent validations
-    for i, result in enumerate(sorted_results[:10]):  # Show last 10 validations
-        # Find the policy this validation belongs to
-        policy = None
-        for p in session.generated_policies:
-            if p.id == result.policy_id:
-                policy = p
-                break
-        
-        policy_name = f"Policy {result.policy_id[:8]}..." if policy else "Unknown Policy"
+    for result in recent_results:
+        policy_name = f"Policy {result.policy_id[:8]}..." if result.policy_id in policy_ids else "Unknown Policy"
         
         # Create expandable entry for each validation
         status_icon = "✅" if result.is_valid else "❌"
@@ -236,16 +247,18 @@ def render_validation_history(session: Session) -> None:
                 st.code(result.error_message, language="text")
     
     # Show total count if there are more results
-    if len(sorted_results) > 10:
-        st.caption(f"Showing 10 most recent validations out of {len(sorted_results)} total.")
+    if len(session.validation_results) > 10:
+        st.caption(f"Showing 10 most recent validations out of {len(session.validation_results)} total.")
 
 
-def render_validation_metrics(session: Session) -> None:
+def render_validation_metrics(session: Session,
+                              recent_results: Optional[List[ValidationResult]] = None) -> None:
     """
     Render validation success metrics and statistics.
     
     Args:
         session: Current session
+        recent_results: Validation results sorted newest first, if already computed
     """
     st.subheader("📊 Validation Metrics")
     
@@ -253,14 +266,20 @@ def render_validation_metrics(session: Session) -> None:
         st.info("📝 No validation data available.")
         return
     
-    # Calculate metrics
+    # Calculate metrics in a single pass
     total_validations = len(session.validation_results)
-    successful_validations = sum(1 for r in session.validation_results if r.is_valid)
+    successful_validations = 0
+    total_validation_time = 0.0
+    for result in session.validation_results:
+        if result.is_valid:
+            successful_validations += 1
+        total_validation_time += result.validation_time
+    
     failed_validations = total_validations - successful_validations
     success_rate = (successful_validations / total_validations) * 100 if total_validations > 0 else 0
     
     # Average validation time
-    avg_validation_time = sum(r.validation_time for r in session.validation_results) / total_validations if total_validations > 0 else 0
+    avg_validation_time = total_validation_time / total_validations if total_validations > 0 else 0
     
     # Display metrics
     col1, col2 = st.columns(2)
@@ -280,8 +299,9 @@ def render_validation_metrics(session: Session) -> None:
     
     # Recent validation trend (last 5 validations)
     if total_validations >= 5:
-        recent_results = sorted(session.validation_results, key=lambda r: r.validated_at, reverse=True)[:5]
-        recent_success_rate = (sum(1 for r in recent_results if r.is_valid) / 5) * 100
+        if recent_results is None:
+            recent_results = session.get_recent_validations(5)
+        recent_success_rate = (sum(1 for r in recent_results[:5] if r.is_valid) / 5) * 100
         
         st.write("**Recent Trend (Last 5)**")
         trend_delta = recent_success_rate - success_rate
@@ -293,18 +313,9 @@ def render_validation_metrics(session: Session) -> None:
     if len(session.generated_policies) > 1:
         st.write("**Per-Policy Metrics**")
         
-        policy_metrics = {}
-        for result in session.validation_results:
-            if result.policy_id not in policy_metrics:
-                policy_metrics[result.policy_id] = {"total": 0, "successful": 0}
-            
-            policy_metrics[result.policy_id]["total"] += 1
-            if result.is_valid:
-                policy_metrics[result.policy_id]["successful"] += 1
-        
-        for policy_id, metrics in policy_metrics.items():
-            policy_success_rate = (metrics["successful"] / metrics["total"]) * 100
-            st.write(f"Policy {policy_id[:8]}...: {metrics['successful']}/{metrics['total']} ({policy_success_rate:.1f}%)")
+        for policy_id, (total, successful) in session.get_validation_counts().items():
+            policy_success_rate = (successful / total) * 100
+            st.write(f"Policy {policy_id[:8]}...: {successful}/{total} ({policy_success_rate:.1f}%)")
 
 
 def render_validation_error_analysis(session: Session) -> None:
@@ -316,33 +327,16 @@ def render_validation_error_analysis(session: Session) -> None:
     """
     st.subheader("🔍 Error Analysis")
     
-    failed_validations = [r for r in session.validation_results if not r.is_valid and r.error_message]
+    # Group errors by similarity (simple keyword matching) in one pass over the results
+    failed_validations = (r for r in session.validation_results if not r.is_valid and r.error_message)
+    error_groups: Dict[str, List[ValidationResult]] = defaultdict(list)
+    for result in failed_validations:
+        error_groups[_categorize_error(result.error_message)].append(result)
     
-    if not failed_validations:
+    if not error_groups:
         st.info("✅ No validation errors to analyze.")
         return
     
-    # Group errors by similarity (simple keyword matching)
-    error_groups = {}
-    for result in failed_validations:
-        error_msg = result.error_message.lower()
-        
-        # Simple error categorization
-        if "syntax" in error_msg:
-            category = "Syntax Errors"
-        elif "undefined" in error_msg or "not found" in error_msg:
-            category = "Undefined References"
-        elif "type" in error_msg:
-            category = "Type Errors"
-        elif "permission" in error_msg or "allow" in error_msg:
-            category = "Permission Logic"
-        else:
-            category = "Other Errors"
-        
-        if category not in error_groups:
-            error_groups[category] = []
-        error_groups[category].append(result)
-    
     # Display error groups
     for category, errors in error_groups.items():
         with st.expander(f"{category} ({len(errors)} occurrences)"):
@@ -353,7 +347,33 @@ def render_validation_error_analysis(session: Session) -> None:
                 st.caption(f"... and {len(errors) - 3} more similar errors")
 
 
+def _categorize_error(error_message: str) -> str:
+    """Categorize an error message by simple keyword matching."""
+    error_msg = error_message.lower()
+    for keyword, category in _ERROR_CATEGORY_KEYWORDS:
+        if keyword in error_msg:
+            return category
+    return "Other Errors"
+
+
 # Helper functions for async operations in Streamlit
+@st.cache_resource
+def _get_validation_executor() -> ThreadPoolExecutor:
+    """Get the validation worker pool shared by all browser sessions."""
+    return ThreadPoolExecutor(max_workers=5, thread_name_prefix="async-validation")
+
+
+def _get_validator() -> AsyncPolarValidator:
+    """Get this browser session's async validator, keeping its result cache across reruns.
+    
+    The validator's cache, history and stats are not thread-safe, so each session
+    gets its own instance; only the worker pool is shared.
+    """
+    if "async_validator" not in st.session_state:
+        st.session_state["async_validator"] = AsyncPolarValidator(executor=_get_validation_executor())
+    return st.session_state["async_validator"]
+
+
 def run_async_validation(policy_content: str, policy_id: str, session_id: str) -> PolicyValidationResult:
     """
     Helper function to run async validation in Streamlit context.
@@ -367,13 +387,6 @@ def run_async_validation(policy_content: str, policy_id: str, session_id: str) -
         PolicyValidationResult
     """
     try:
-        # Create new event loop for this thread
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        # Initialize validator
-        validator = AsyncPolarValidator()
-        
         # Create validation request
         request = PolicyValidationRequest(
             policy_content=policy_content,
@@ -382,13 +395,7 @@ def run_async_validation(policy_content: str, policy_id: str, session_id: str) -
         )
         
         # Run validation
-        result = loop.run_until_complete(validator.validate_policy_async(request))
-        
-        # Clean up
-        loop.run_until_complete(validator.close())
-        loop.close()
-        
-        return result
+        return asyncio.run(_get_validator().validate_policy_async(request))
         
     except Exception as e:
         return PolicyValidationResult(
@@ -418,9 +425,9 @@ def get_error_severity(error_message: str) -> str:
     
     error_lower = error_message.lower()
     
-    if any(keyword in error_lower for keyword in ["fatal", "critical", "severe"]):
+    if "fatal" in error_lower or "critical" in error_lower or "severe" in error_lower:
         return "error"
-    elif any(keyword in error_lower for keyword in ["warning", "deprecated"]):
+    elif "warning" in error_lower or "deprecated" in error_lower:
         return "warning"
     else:
         return "error"  # Default to error for validation failures
\ No newline at end of file
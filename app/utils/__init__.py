@@ -1,3 +1,3 @@
-from .file_utils import read_file, resolve_file_path, find_file_by_name
+from .file_utils import read_file, read_file_bytes, resolve_file_path, find_file_by_name
 
-__all__ = ['read_file', 'resolve_file_path', 'find_file_by_name'] 
\ No newline at end of file
+__all__ = ['read_file', 'read_file_bytes', 'resolve_file_path', 'find_file_by_name'] 
\ No newline at end of file
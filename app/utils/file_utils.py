@@ -1,7 +1,17 @@
+import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+# Files larger than this are read directly rather than kept in the content cache
+MAX_CACHED_FILE_SIZE = 1024 * 1024
+
+# Directories skipped when searching for files by name
+PRUNED_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", ".mypy_cache", ".pytest_cache"}
+
 def resolve_file_path(file_path: str, base_dir: str = None) -> Optional[Path]:
     """
     Resolve a file path to an absolute Path object.
@@ -17,25 +27,22 @@ def resolve_file_path(file_path: str, base_dir: str = None) -> Optional[Path]:
         if base_dir is None:
             base_dir = os.getcwd()
         
-        # Convert to Path object
-        path = Path(file_path)
-        
-        # If it's already absolute, use as is
-        if path.is_absolute():
-            resolved_path = path
+        # Work on plain strings and only build a Path for the result
+        if os.path.isabs(file_path):
+            resolved_path = file_path
         else:
             # Resolve relative to base directory
-            resolved_path = Path(base_dir) / path
+            resolved_path = os.path.join(base_dir, file_path)
         
         # Check if file exists
-        if resolved_path.exists():
-            return resolved_path.resolve()
-        else:
-            print(f"Error: File '{file_path}' not found at {resolved_path}")
-            return None
+        if os.path.isfile(resolved_path):
+            return Path(os.path.realpath(resolved_path))
+        
+        logger.debug("File '%s' not found at %s", file_path, resolved_path)
+        return None
             
-    except Exception as e:
-        print(f"Error resolving file path '{file_path}': {e}")
+    except OSError as e:
+        logger.debug("Error resolving file path '%s': %s", file_path, e)
         return None
 
 def find_file_by_name(filename: str, search_dirs: list[str] = None) -> Optional[Path]:
@@ -54,17 +61,26 @@ def find_file_by_name(filename: str, search_dirs: list[str] = None) -> Optional[
             search_dirs = [os.getcwd()]
         
         for search_dir in search_dirs:
-            search_path = Path(search_dir)
-            if search_path.exists():
-                for file_path in search_path.rglob(filename):
-                    if file_path.is_file():
-                        return file_path.resolve()
+            # Depth-first walk with scandir; DirEntry caches file type info
+            stack = [search_dir]
+            while stack:
+                directory = stack.pop()
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name not in PRUNED_DIRS:
+                                    stack.append(entry.path)
+                            elif entry.name == filename and entry.is_file():
+                                return Path(entry.path).resolve()
+                except OSError:
+                    continue
         
-        print(f"Error: File '{filename}' not found in search directories")
+        logger.debug("File '%s' not found in search directories", filename)
         return None
         
-    except Exception as e:
-        print(f"Error finding file '{filename}': {e}")
+    except OSError as e:
+        logger.debug("Error finding file '%s': %s", filename, e)
         return None
 
 def read_file(file_path: str, base_dir: str = None) -> Optional[str]:
@@ -84,11 +100,42 @@ def read_file(file_path: str, base_dir: str = None) -> Optional[str]:
         if resolved_path is None:
             return None
         
-        # Read the file
-        with open(resolved_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        return content
+        # Serve unchanged files from the cache; modification time and size
+        # are part of the key so edits on disk are picked up
+        stat_result = resolved_path.stat()
+        if stat_result.st_size > MAX_CACHED_FILE_SIZE:
+            with open(resolved_path, 'r', encoding='utf-8') as file:
+                return file.read()
+        return _read_file_cached(str(resolved_path), stat_result.st_mtime_ns, stat_result.st_size)
+        
+    except (OSError, UnicodeDecodeError) as e:
+        logger.warning("Error reading file '%s': %s", file_path, e)
+        return None
+
+def read_file_bytes(file_path: str, base_dir: str = None) -> Optional[bytes]:
+    """
+    Read a file and return its raw content without decoding.
+    
+    Args:
+        file_path (str): Path to the file to read (can be relative or absolute)
+        base_dir (str): Base directory for relative paths
+    
+    Returns:
+        Optional[bytes]: The raw content of the file, or None if there's an error
+    """
+    try:
+        resolved_path = resolve_file_path(file_path, base_dir)
+        if resolved_path is None:
+            return None
+        
+        return resolved_path.read_bytes()
         
-    except Exception as e:
-        print(f"Error reading file '{file_path}': {e}")
-        return None 
\ No newline at end of file
+    except OSError as e:
+        logger.warning("Error reading file '%s': %s", file_path, e)
+        return None
+
+@lru_cache(maxsize=128)
+def _read_file_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a file's content; cached by (path, mtime_ns, size)."""
+    with open(path, 'r', encoding='utf-8') as file:
+        return file.read()
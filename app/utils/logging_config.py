@@ -1,12 +1,71 @@
 """Logging configuration for the Polar Prompt Tester application."""
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
+import time
+from collections import deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+
+# Background listener that writes console and file output; replaced by each setup_logging call
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Streamlit handler installed by the latest setup_logging call
+_streamlit_handler: Optional["StreamlitLogHandler"] = None
+
+# Environment variable prefixes shown in the debug info, and how long (seconds) the
+# filtered variables are reused before os.environ is scanned again
+_DEBUG_ENV_PREFIXES = ('OPENAI_', 'AWS_', 'STREAMLIT_')
+_DEBUG_ENV_TTL = 2.0
+_debug_env_cache: Tuple[float, Dict[str, str]] = (float('-inf'), {})
+
+# Icons shown next to each level in the log viewer
+_LEVEL_ICONS = {
+    'DEBUG': '🐛',
+    'INFO': 'ℹ️',
+    'WARNING': '⚠️',
+    'ERROR': '❌',
+    'CRITICAL': '🚨'
+}
+
+
+class CachingFormatter(logging.Formatter):
+    """Formatter that formats each record once, however many handlers share it."""
+    
+    # (second, datefmt, formatted time) of the last formatted timestamp
+    _time_cache = (None, None, "")
+    
+    def format(self, record):
+        """Format a record, reusing the result if this formatter already formatted it."""
+        cached = record.__dict__.get('_formatted_line')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        
+        line = super().format(record)
+        record._formatted_line = (self, line)
+        return line
+    
+    def formatTime(self, record, datefmt=None):
+        """Format the record time, reusing the string for records in the same second."""
+        if datefmt is None:
+            # The default format includes milliseconds, so it can't be reused
+            return super().formatTime(record, datefmt)
+        
+        second = int(record.created)
+        cached = self._time_cache
+        if cached[0] == second and cached[1] == datefmt:
+            return cached[2]
+        
+        formatted = super().formatTime(record, datefmt)
+        self._time_cache = (second, datefmt, formatted)
+        return formatted
 
 
 class StreamlitLogHandler(logging.Handler):
@@ -15,25 +74,21 @@ class StreamlitLogHandler(logging.Handler):
     def __init__(self, streamlit_container=None):
         super().__init__()
         self.streamlit_container = streamlit_container
-        self.log_buffer = []
         self.max_buffer_size = 100
+        self.log_buffer = deque(maxlen=self.max_buffer_size)
     
     def emit(self, record):
         """Emit a log record."""
         try:
             msg = self.format(record)
             self.log_buffer.append({
-                'timestamp': datetime.fromtimestamp(record.created),
+                'timestamp': record.created,  # Converted to a datetime only when displayed
                 'level': record.levelname,
                 'message': msg,
                 'module': record.module,
                 'funcName': record.funcName
             })
             
-            # Maintain buffer size
-            if len(self.log_buffer) > self.max_buffer_size:
-                self.log_buffer = self.log_buffer[-self.max_buffer_size:]
-            
             # If we have a Streamlit container, display the log
             if self.streamlit_container and record.levelno >= logging.WARNING:
                 self._display_in_streamlit(record, msg)
@@ -56,13 +111,14 @@ class StreamlitLogHandler(logging.Handler):
             pass  # Fail silently if Streamlit is not available
     
     def get_recent_logs(self, level: Optional[str] = None, limit: int = 50):
-        """Get recent log entries."""
-        logs = self.log_buffer[-limit:]
-        
-        if level:
-            level_upper = level.upper()
-            logs = [log for log in logs if log['level'] == level_upper]
+        """Get up to `limit` of the most recent log entries, optionally of one level, oldest first."""
+        if not level:
+            return list(islice(self.log_buffer, max(0, len(self.log_buffer) - limit), None))
         
+        # Walk back from the newest entry and stop once enough matches are found
+        level_upper = level.upper()
+        logs = list(islice((log for log in reversed(self.log_buffer) if log['level'] == level_upper), limit))
+        logs.reverse()
         return logs
 
 
@@ -90,6 +146,8 @@ def setup_logging(
     Returns:
         StreamlitLogHandler instance for accessing logs
     """
+    global _log_listener, _streamlit_handler
+    
     # Convert log level string to logging constant
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
     
@@ -97,21 +155,34 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
     
-    # Clear existing handlers
+    # Clear existing handlers, writing out anything a previous listener still has queued
+    _stop_log_listener()
     root_logger.handlers.clear()
     
-    # Create formatter
-    formatter = logging.Formatter(
+    # Create one formatter shared by all handlers, so each record is formatted once
+    formatter = CachingFormatter(
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
+    # Streamlit handler; stays on the logging thread since it only buffers in memory
+    # and may write to a Streamlit container. It is added before the queue handler so
+    # the line it formats is carried on the queued record and reused by the listener
+    streamlit_handler = StreamlitLogHandler(streamlit_container)
+    streamlit_handler.setLevel(logging.WARNING)  # Only show warnings and errors in UI
+    streamlit_handler.setFormatter(formatter)
+    root_logger.addHandler(streamlit_handler)
+    _streamlit_handler = streamlit_handler
+    
+    # Handlers that do I/O are run by a background listener rather than the logging thread
+    io_handlers = []
+    
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(numeric_level)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        io_handlers.append(console_handler)
     
     # File handler
     if log_file:
@@ -129,13 +200,13 @@ def setup_logging(
         
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        io_handlers.append(file_handler)
     
-    # Streamlit handler
-    streamlit_handler = StreamlitLogHandler(streamlit_container)
-    streamlit_handler.setLevel(logging.WARNING)  # Only show warnings and errors in UI
-    streamlit_handler.setFormatter(formatter)
-    root_logger.addHandler(streamlit_handler)
+    if io_handlers:
+        log_queue = queue.Queue(-1)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener = logging.handlers.QueueListener(log_queue, *io_handlers, respect_handler_level=True)
+        _log_listener.start()
     
     # Set specific logger levels
     logging.getLogger("openai").setLevel(logging.WARNING)
@@ -151,6 +222,18 @@ def setup_logging(
     return streamlit_handler
 
 
+def _stop_log_listener() -> None:
+    """Stop the background log listener, writing out any queued records."""
+    global _log_listener
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+atexit.register(_stop_log_listener)
+
+
 def get_log_file_path() -> str:
     """Get the default log file path."""
     log_dir = Path("logs")
@@ -181,11 +264,7 @@ def display_log_viewer():
     st.subheader("📋 Application Logs")
     
     # Get the Streamlit log handler
-    streamlit_handler = None
-    for handler in logging.getLogger().handlers:
-        if isinstance(handler, StreamlitLogHandler):
-            streamlit_handler = handler
-            break
+    streamlit_handler = _streamlit_handler
     
     if not streamlit_handler:
         st.warning("⚠️ Log handler not found")
@@ -220,20 +299,15 @@ def display_log_viewer():
     st.markdown("### Recent Log Entries")
     
     for log in reversed(logs):  # Show most recent first
-        timestamp = log['timestamp'].strftime("%H:%M:%S")
-        level_icon = {
-            'DEBUG': '🐛',
-            'INFO': 'ℹ️',
-            'WARNING': '⚠️',
-            'ERROR': '❌',
-            'CRITICAL': '🚨'
-        }.get(log['level'], '📝')
+        log_time = datetime.fromtimestamp(log['timestamp'])
+        timestamp = log_time.strftime("%H:%M:%S")
+        level_icon = _LEVEL_ICONS.get(log['level'], '📝')
         
         with st.expander(
             f"{level_icon} {timestamp} - {log['level']} - {log['message'][:100]}...",
             expanded=False
         ):
-            st.write(f"**Time:** {log['timestamp'].strftime('%Y-%m-%d %H:%M:%S')}")
+            st.write(f"**Time:** {log_time.strftime('%Y-%m-%d %H:%M:%S')}")
             st.write(f"**Level:** {log['level']}")
             st.write(f"**Module:** {log['module']}")
             st.write(f"**Function:** {log['funcName']}")
@@ -252,15 +326,28 @@ def get_debug_info() -> dict:
         "platform": platform.platform(),
         "streamlit_version": st.__version__,
         "session_state_keys": list(st.session_state.keys()) if hasattr(st, 'session_state') else [],
-        "environment_variables": {
-            key: value for key, value in os.environ.items() 
-            if key.startswith(('OPENAI_', 'AWS_', 'STREAMLIT_'))
-        }
+        "environment_variables": _get_debug_environment()
     }
     
     return debug_info
 
 
+def _get_debug_environment() -> Dict[str, str]:
+    """Get the debug-relevant environment variables, rescanning os.environ at most every few seconds."""
+    global _debug_env_cache
+    
+    cached_at, variables = _debug_env_cache
+    now = time.monotonic()
+    if now - cached_at >= _DEBUG_ENV_TTL:
+        variables = {
+            key: value for key, value in os.environ.items()
+            if key.startswith(_DEBUG_ENV_PREFIXES)
+        }
+        _debug_env_cache = (now, variables)
+    
+    return variables
+
+
 def display_debug_info():
     """Display debug information in Streamlit."""
     import streamlit as st
@@ -6,6 +6,7 @@ import tempfile
 import os
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 
 from app.services.async_validator import AsyncPolarValidator, ValidationCacheEntry, ValidationHistoryEntry
 from app.models.policy import PolicyValidationRequest, PolicyValidationResult
@@ -353,4 +354,16 @@ async def test_cleanup_resources(async_validator):
     await async_validator.close()
     
     # Executor should be shut down
-    assert async_validator.executor._shutdown is True
\ No newline at end of file
+    assert async_validator.executor._shutdown is True
+
+@pytest.mark.asyncio
+async def test_close_keeps_shared_executor():
+    """Test close() leaves an executor passed in by the caller running."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    validator = AsyncPolarValidator(cli_path="mock-oso-cloud", executor=executor)
+    
+    await validator.close()
+    
+    assert validator.executor is executor
+    assert executor._shutdown is False
+    executor.shutdown()
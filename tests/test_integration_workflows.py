@@ -212,6 +212,42 @@ class TestCompleteUserWorkflows:
         assert len(loaded_session.validation_results) == 1
         assert loaded_session.validation_results[0].is_valid is False
     
+    def test_streaming_workflow_yields_chunks(self, session_manager, policy_generator):
+        """Test streaming generation yields deltas and returns the final result."""
+        session = session_manager.create_session("Streaming Session")
+        session.requirements_text = "Allow admins to read resources"
+
+        def fake_stream(request, session):
+            yield 'allow(user, "read", resource) '
+            yield 'if user.role = "admin";'
+            return PolicyGenerationResult(
+                success=True,
+                policy_content='allow(user, "read", resource) if user.role = "admin";',
+                model_used="gpt-4",
+                tokens_used=150,
+                generation_time=2.5
+            )
+
+        policy_generator.ai_service.iter_policy_stream.side_effect = fake_stream
+
+        generation_request = PolicyGenerationRequest(
+            session_id=session.id,
+            requirements_text=session.requirements_text
+        )
+
+        chunks = policy_generator.iter_chunks(generation_request, session)
+        streamed = []
+        try:
+            while True:
+                streamed.append(next(chunks))
+        except StopIteration as stop:
+            result = stop.value
+
+        assert streamed == ['allow(user, "read", resource) ', 'if user.role = "admin";']
+        assert result.is_successful()
+        assert len(session.generated_policies) == 1
+        assert session.generated_policies[0].content == ''.join(streamed)
+
     def test_multiple_sessions_workflow(self, session_manager, policy_generator):
         """Test workflow with multiple concurrent sessions."""
         sessions = []
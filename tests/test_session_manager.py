@@ -162,6 +162,35 @@ class TestSessionManager:
         assert "Session 2" in session_names
         assert "Session 1" in session_names
     
+    def test_list_session_summaries(self, session_manager):
+        """Test listing lightweight session summaries."""
+        session1 = session_manager.create_session("Session 1")
+        session2 = session_manager.create_session("Session 2")
+        
+        with patch.object(session_manager, 'load_session') as mock_load:
+            summaries = session_manager.list_session_summaries()
+            mock_load.assert_not_called()
+        
+        assert sorted(summaries) == sorted([(session1.id, "Session 1"), (session2.id, "Session 2")])
+    
+    def test_version_bumped_on_changes(self, session_manager):
+        """Test that creating, saving and deleting sessions bumps the version."""
+        assert session_manager.version == 0
+        
+        session = session_manager.create_session("Session 1")
+        assert session_manager.version == 1
+        
+        session_manager.load_session(session.id)
+        session_manager.list_sessions()
+        assert session_manager.version == 1
+        
+        session.notes = "Updated"
+        session_manager.save_session(session)
+        assert session_manager.version == 2
+        
+        session_manager.delete_session(session.id)
+        assert session_manager.version == 3
+    
     def test_list_sessions_with_limit(self, session_manager):
         """Test listing sessions with limit."""
         # Create multiple sessions
@@ -171,6 +200,20 @@ class TestSessionManager:
         sessions = session_manager.list_sessions(limit=3)
         assert len(sessions) == 3
     
+    def test_list_sessions_with_offset(self, session_manager):
+        """Test paging through sessions with offset and limit."""
+        for i in range(5):
+            session_manager.create_session(f"Session {i}")
+        
+        all_ids = [s.id for s in session_manager.list_sessions()]
+        
+        with patch.object(session_manager, 'load_session', wraps=session_manager.load_session) as mock_load:
+            page = session_manager.list_sessions(limit=2, offset=2)
+            assert mock_load.call_count == 2
+        
+        assert [s.id for s in page] == all_ids[2:4]
+        assert session_manager.list_sessions(limit=2, offset=5) == []
+    
     def test_list_sessions_with_search(self, session_manager):
         """Test listing sessions with search term."""
         session_manager.create_session("Test Session")
@@ -437,6 +480,81 @@ class TestSessionManager:
         assert loaded_validations[policy1.id].is_valid is True
         assert loaded_validations[policy2.id].is_valid is False
         assert loaded_validations[policy2.id].error_message == "Syntax error"
+        
+        # Verify lookups on the loaded session
+        assert loaded_session.get_policy(policy2.id).content == policy2.content
+        assert loaded_session.get_latest_validation(policy2.id).is_valid is False
+    
+    def test_remove_policy_updates_lookups(self, sample_session):
+        """Test removing a policy drops it and its validation results."""
+        policy1 = GeneratedPolicy.create(content="allow(a, b, c);", model_used="gpt-4")
+        policy2 = GeneratedPolicy.create(content="allow(d, e, f);", model_used="gpt-4")
+        sample_session.add_policy(policy1)
+        sample_session.add_policy(policy2)
+        sample_session.add_validation_result(ValidationResult.create(policy_id=policy2.id, is_valid=False))
+        
+        removed = sample_session.remove_policy(policy2.id)
+        
+        assert removed is policy2
+        assert sample_session.get_policy(policy2.id) is None
+        assert sample_session.get_latest_validation(policy2.id) is None
+        assert sample_session.validation_results == []
+        assert sample_session.get_current_policy() is policy1
+        assert sample_session.remove_policy(policy2.id) is None
+    
+    def test_validation_counts_by_policy(self, sample_session):
+        """Test per-policy validation counts track additions, removals and clears."""
+        policy1 = GeneratedPolicy.create(content="allow(a, b, c);", model_used="gpt-4")
+        policy2 = GeneratedPolicy.create(content="allow(d, e, f);", model_used="gpt-4")
+        sample_session.add_policy(policy1)
+        sample_session.add_policy(policy2)
+        sample_session.add_validation_result(ValidationResult.create(policy_id=policy1.id, is_valid=True))
+        sample_session.add_validation_result(ValidationResult.create(policy_id=policy1.id, is_valid=False))
+        sample_session.add_validation_result(ValidationResult.create(policy_id=policy2.id, is_valid=True))
+        
+        assert sample_session.get_validation_counts() == {policy1.id: (2, 1), policy2.id: (1, 1)}
+        
+        sample_session.remove_policy(policy2.id)
+        assert sample_session.get_validation_counts() == {policy1.id: (2, 1)}
+        
+        sample_session.clear_validation_results()
+        assert sample_session.get_validation_counts() == {}
+    
+    def test_index_follows_replaced_lists(self, sample_session):
+        """Test lookups see lists replaced wholesale with a same-length list."""
+        policy1 = GeneratedPolicy.create(content="allow(a, b, c);", model_used="gpt-4")
+        policy2 = GeneratedPolicy.create(content="allow(d, e, f);", model_used="gpt-4")
+        sample_session.add_policy(policy1)
+        sample_session.add_validation_result(ValidationResult.create(policy_id=policy1.id, is_valid=True))
+        
+        sample_session.generated_policies = [policy2]
+        sample_session.validation_results = [ValidationResult.create(policy_id=policy2.id, is_valid=False)]
+        
+        assert sample_session.get_policy(policy1.id) is None
+        assert sample_session.get_policy(policy2.id) is policy2
+        assert sample_session.get_latest_validation(policy1.id) is None
+        assert sample_session.get_validation_counts() == {policy2.id: (1, 0)}
+    
+    def test_recent_validations_newest_first(self, sample_session):
+        """Test recent validations come back newest first, even when added out of order."""
+        base = datetime(2024, 1, 1)
+        results = []
+        for minutes in (0, 2, 1):
+            result = ValidationResult.create(policy_id="policy", is_valid=True)
+            result.validated_at = base + timedelta(minutes=minutes)
+            results.append(result)
+            sample_session.add_validation_result(result)
+        
+        assert sample_session.get_recent_validations(2) == [results[1], results[2]]
+        assert sample_session.get_recent_validations(10) == [results[1], results[2], results[0]]
+        
+        # Results appended directly (as when loading from storage) are reordered too
+        older = ValidationResult.create(policy_id="policy", is_valid=False)
+        older.validated_at = base - timedelta(minutes=1)
+        sample_session.validation_results.append(older)
+        assert sample_session.get_recent_validations(10)[-1] is older
+        # ...without the read reordering the session's own list
+        assert sample_session.validation_results[-1] is older
     
     def test_concurrent_session_operations(self, session_manager):
         """Test concurrent session operations don't interfere."""
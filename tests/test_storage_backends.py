@@ -154,6 +154,17 @@ class TestLocalStorageBackend:
         assert "prefix1/file1.txt" in keys
         assert "prefix1/file2.txt" in keys
     
+    def test_list_objects_with_partial_key_prefix(self, storage):
+        """Test listing objects with a prefix that ends mid-name."""
+        storage.put_object("backups/s1_20240101.json", "content1")
+        storage.put_object("backups/s1_20240102.json", "content2")
+        storage.put_object("backups/s10_20240101.json", "content3")
+        storage.put_object("backups/s2_20240101.json", "content4")
+        
+        result = storage.list_objects(prefix="backups/s1_")
+        keys = sorted(obj.key for obj in result['objects'])
+        assert keys == ["backups/s1_20240101.json", "backups/s1_20240102.json"]
+    
     def test_list_objects_with_max_keys(self, storage):
         """Test listing objects with max_keys limit."""
         # Create multiple objects
@@ -274,6 +285,17 @@ class TestLocalStorageBackend:
         for key in keys[:3]:
             assert not storage.object_exists(key)
     
+    def test_batch_get_objects(self, storage):
+        """Test batch retrieval of objects."""
+        storage.put_object("file1.txt", "content 1")
+        storage.put_object("dir/file2.txt", "content 2")
+        
+        results = storage.batch_get_objects(["file1.txt", "dir/file2.txt", "nonexistent.txt"])
+        
+        assert set(results) == {"file1.txt", "dir/file2.txt"}  # Missing keys are omitted
+        assert results["file1.txt"].content == "content 1"
+        assert results["dir/file2.txt"].content == "content 2"
+    
     def test_session_specific_operations(self, storage):
         """Test session-specific storage operations."""
         session_id = "test-session-123"